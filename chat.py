@@ -1,9 +1,13 @@
 """Streamlit frontend for the AWS Agentic Agent."""
 
 import os
-from typing import Any
+import uuid
+from collections import deque
+from collections.abc import Iterator
+from typing import TypedDict
 
 import httpx
+import orjson
 import streamlit as st
 from dotenv import load_dotenv
 
@@ -11,11 +15,58 @@ load_dotenv()
 
 API_URL = os.getenv("API_URL", "http://localhost:8000")
 
+HISTORY_MAX = int(os.getenv("HISTORY_MAX", "50"))
+
+
+@st.cache_resource
+def get_http_client() -> httpx.Client:
+    """Create the HTTP client shared by all reruns and sessions for connection reuse."""
+    return httpx.Client(
+        base_url=API_URL,
+        timeout=120.0,
+        limits=httpx.Limits(max_keepalive_connections=8),
+    )
+
+
+class StreamEvent(TypedDict, total=False):
+    """A server-sent event from /chat/stream."""
+
+    delta: str
+    done: bool
+    updated_history: list[dict[str, str]]
+    error: str
+
+
+def iter_sse_deltas(chunks: Iterator[bytes], final_event: StreamEvent) -> Iterator[str]:
+    """Yield response text from raw server-sent event bytes, collecting the closing event into final_event.
+
+    Events are split and parsed as bytes so orjson reads them directly, without an
+    intermediate decode to text.
+    """
+    buffer = b""
+    for chunk in chunks:
+        buffer += chunk
+        *events, buffer = buffer.split(b"\n\n")
+        for raw_event in events:
+            if not raw_event.startswith(b"data: "):
+                continue
+            event: StreamEvent = orjson.loads(raw_event[6:])
+            if "delta" in event:
+                yield event["delta"]
+            else:
+                final_event.update(event)
+
+
 st.set_page_config(page_title="Agentic AWS Chatbot", layout="centered")
 st.title("Agentic AWS Chatbot")
 
+# Only the most recent messages are kept and re-rendered on each rerun.
 if "messages" not in st.session_state:
-    st.session_state["messages"] = []
+    st.session_state["messages"] = deque(maxlen=HISTORY_MAX)
+
+# The backend keeps the conversation for this id, so only new messages cross the wire.
+if "session_id" not in st.session_state:
+    st.session_state["session_id"] = uuid.uuid4().hex
 
 for msg in st.session_state["messages"]:
     with st.chat_message(msg["role"]):
@@ -30,20 +81,24 @@ if user_input:
 
     with st.chat_message("assistant"), st.spinner("Thinking..."):
         try:
-            with httpx.Client(timeout=120.0) as client:
-                response = client.post(
-                    f"{API_URL}/chat",
-                    json={
-                        "message": user_input,
-                        "history": st.session_state["messages"],
-                    },
-                )
+            final_event: StreamEvent = {}
+            with get_http_client().stream(
+                "POST",
+                "/chat/stream",
+                json={
+                    "message": user_input,
+                    "session_id": st.session_state["session_id"],
+                },
+            ) as response:
                 response.raise_for_status()
+                reply = st.write_stream(iter_sse_deltas(response.iter_bytes(), final_event))
 
-            data: dict[str, Any] = response.json()
-            reply = data.get("response", "No reply received.")
-            st.session_state["messages"] = data.get("updated_history", st.session_state["messages"])
-            st.markdown(reply)
+            if "error" in final_event:
+                error_msg = f"Error: {final_event['error']}"
+                st.markdown(error_msg)
+                st.session_state["messages"].append({"role": "assistant", "content": error_msg})
+            else:
+                st.session_state["messages"].append({"role": "assistant", "content": reply})
 
         except httpx.HTTPStatusError as e:
             error_msg = f"Error: Server returned {e.response.status_code}"
@@ -1,48 +1,159 @@
 """FastAPI application for the AWS Agentic Agent."""
 
+import asyncio
+import logging
 import os
+import time
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Annotated, Any
 
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
+from limits import parse as parse_rate_limit
+from pydantic import ValidationError
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
+from agentic_aws.cache import ResponseCache, is_replayable_turn
+from agentic_aws.config import AWSConfig
 from agentic_aws.exceptions import AWSAgentError
 from agentic_aws.logging import get_logger, setup_logging
-from agentic_aws.models import ChatRequest, ChatResponse
-from agentic_aws.processor import process_request
+from agentic_aws.models import CHAT_HISTORY_ADAPTER, ChatMessage, ChatRequest, ChatResponse
+from agentic_aws.processor import process_request_async, stream_request_async
+from agentic_aws.sessions import SessionStore, create_session_store, trim_history
 
 load_dotenv()
 
 setup_logging(level=os.getenv("LOG_LEVEL", "INFO"))
 logger = get_logger(__name__)
 
-ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "http://localhost:8501,http://127.0.0.1:8501").split(",")
+ALLOWED_ORIGINS = tuple(
+    origin.strip()
+    for origin in os.getenv("ALLOWED_ORIGINS", "http://localhost:8501,http://127.0.0.1:8501").split(",")
+    if origin.strip()
+)
 
 RATE_LIMIT = os.getenv("RATE_LIMIT", "10/minute")
+parse_rate_limit(RATE_LIMIT)  # Fail at startup rather than on the first /chat request
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "60"))
+
+# Most recent history messages sent to the model, for sessions and client-supplied history alike.
+SESSION_HISTORY_MAX = int(os.getenv("SESSION_HISTORY_MAX", "20"))
+
+READY_CACHE_TTL = float(os.getenv("READY_CACHE_TTL", "10"))
+
+AGENT_CONCURRENCY = int(os.getenv("AGENT_CONCURRENCY", "16"))
+
+# Counters live in Redis when configured so every worker and replica shares one limit.
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=REDIS_URL or "memory://",
+    strategy="moving-window",
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create per-process resources bound to the running event loop."""
+    # Caps concurrent agent runs so boto3 and Anthropic calls do not pile up in worker threads.
+    app.state.agent_slots = asyncio.Semaphore(AGENT_CONCURRENCY)
+    # Agent runs are offloaded with asyncio.to_thread; the default executor is sized from the
+    # CPU count, which would otherwise cap concurrent runs well below AGENT_CONCURRENCY.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=AGENT_CONCURRENCY, thread_name_prefix="agent")
+    )
+    yield
 
-limiter = Limiter(key_func=get_remote_address)
 
 app = FastAPI(
     title="Agentic AWS API",
     description="AI-powered AWS infrastructure management through natural language",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.state.limiter = limiter
+app.state.response_cache = ResponseCache(ttl_seconds=RESPONSE_CACHE_TTL)
+app.state.session_store = create_session_store(REDIS_URL, max_messages=SESSION_HISTORY_MAX)
+# (checked_at, error) of the last AWS connectivity check; error is None when ready.
+app.state.readiness = (float("-inf"), None)
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+# Large history payloads compress well; event streams are left uncompressed by the middleware.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST"],
     allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
 
+async def parse_chat_request(request: Request) -> ChatRequest:
+    """Parse and validate the chat request body in a single pydantic-core pass.
+
+    FastAPI would decode the body with json.loads and then validate the resulting
+    dicts; model_validate_json does both in Rust straight from the raw bytes.
+    """
+    try:
+        return ChatRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        ) from e
+
+
+# The body is read by parse_chat_request rather than a ChatRequest parameter, so its schema is
+# declared here to keep it in the OpenAPI document. ChatMessage is referenced from the shared
+# components, where ChatResponse already registers it.
+_chat_request_schema = ChatRequest.model_json_schema(ref_template="#/components/schemas/{model}")
+_chat_request_schema.pop("$defs", None)
+CHAT_REQUEST_OPENAPI: dict[str, Any] = {
+    "requestBody": {"required": True, "content": {"application/json": {"schema": _chat_request_schema}}},
+}
+
+
+# Streaming turns that are still running, kept referenced so they finish even after their
+# client has gone away.
+_running_turns: set[asyncio.Task[str]] = set()
+
+
+def _finish_turn(turn: asyncio.Task[str]) -> None:
+    """Forget a finished streaming turn, logging its failure."""
+    _running_turns.discard(turn)
+    if not turn.cancelled() and (error := turn.exception()) is not None:
+        logger.error(f"AWS Agent error: {error}")
+
+
+def sse_event(data: dict[str, Any]) -> bytes:
+    """Encode a server-sent event carrying a JSON payload."""
+    return b"data: " + orjson.dumps(data) + b"\n\n"
+
+
+async def load_history(chat_request: ChatRequest, session_store: SessionStore) -> list[dict[str, Any]]:
+    """Load the history window the agent works on: server-side for sessions, otherwise from the request."""
+    if chat_request.session_id:
+        return await session_store.get_history(chat_request.session_id)
+    # Request history was validated at ingress and the agent works on plain dicts, so only the
+    # messages that can fall inside the window are converted.
+    history: list[dict[str, Any]] = CHAT_HISTORY_ADAPTER.dump_python(chat_request.history[-SESSION_HISTORY_MAX:])
+    return trim_history(history, SESSION_HISTORY_MAX)
+
+
 @app.get("/")
 def root() -> dict[str, str]:
     """Root endpoint."""
@@ -56,42 +167,159 @@ def health() -> dict[str, str]:
 
 
 @app.get("/ready")
-def ready() -> dict[str, str | bool]:
-    """Readiness check endpoint that verifies AWS connectivity."""
-    from agentic_aws.config import AWSConfig
+def ready(request: Request) -> dict[str, str | bool]:
+    """Readiness check endpoint that verifies AWS connectivity.
 
-    try:
-        config = AWSConfig()
-        config.validate_connection()
-        return {"status": "ready", "aws_connected": True}
-    except Exception as e:
-        logger.warning(f"Readiness check failed: {e}")
+    The result is reused for READY_CACHE_TTL seconds so frequent probes do not each
+    make an AWS round-trip.
+    """
+    checked_at, error = request.app.state.readiness
+    now = time.monotonic()
+
+    if now - checked_at >= READY_CACHE_TTL:
+        try:
+            config = AWSConfig()
+            config.validate_connection()
+            error = None
+        except Exception as e:
+            logger.warning(f"Readiness check failed: {e}")
+            error = str(e)
+        request.app.state.readiness = (now, error)
+
+    if error is not None:
         raise HTTPException(
             status_code=503,
-            detail={"status": "not_ready", "aws_connected": False, "error": str(e)},
-        ) from e
+            detail={"status": "not_ready", "aws_connected": False, "error": error},
+        )
+    return {"status": "ready", "aws_connected": True}
 
 
-@app.post("/chat", response_model=ChatResponse)
+@app.post("/chat", response_model=ChatResponse, openapi_extra=CHAT_REQUEST_OPENAPI)
 @limiter.limit(RATE_LIMIT)
-def chat(request: ChatRequest, http_request: Request) -> ChatResponse:
+async def chat(chat_request: Annotated[ChatRequest, Depends(parse_chat_request)], request: Request) -> ChatResponse:
     """Process a chat message and return the agent's response."""
-    logger.info(
-        "Processing chat request",
-        extra={"extra_data": {"client_ip": get_remote_address(http_request)}},
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Processing chat request",
+            extra={"extra_data": {"client_ip": get_remote_address(request)}},
+        )
+
+    response_cache: ResponseCache = request.app.state.response_cache
+    session_store: SessionStore = request.app.state.session_store
+    session_id = chat_request.session_id
 
     try:
-        history = [msg.model_dump() for msg in request.history]
-        response = process_request(request.message, history)
+        history = await load_history(chat_request, session_store)
+        turn_start = len(history)
 
-        updated_history = [{"role": msg["role"], "content": msg["content"]} for msg in history]
+        # Sessions are keyed by their id so one session's reply is never served to another. A
+        # stateless reply echoes the client's whole history back in updated_history, so it is keyed
+        # by that whole history, not by the trimmed window the agent sees.
+        key_history = history if session_id else CHAT_HISTORY_ADAPTER.dump_python(chat_request.history)
+        cache_key = response_cache.make_key(chat_request.message, key_history, scope=session_id or "")
+        cached_response = response_cache.get(cache_key)
+        if cached_response is not None:
+            logger.info("Serving cached chat response")
+            if session_id:
+                await session_store.append(
+                    session_id,
+                    [
+                        {"role": "user", "content": chat_request.message},
+                        {"role": "assistant", "content": cached_response.response},
+                    ],
+                )
+            return cached_response
 
-        return ChatResponse(
+        async with request.app.state.agent_slots:
+            response = await process_request_async(chat_request.message, history)
+
+        updated_history: list[ChatMessage] = []
+        if session_id:
+            await session_store.append(session_id, history[turn_start:])
+        else:
+            updated_history = [
+                *chat_request.history,
+                ChatMessage(role="user", content=chat_request.message),
+                ChatMessage(role="assistant", content=response),
+            ]
+
+        chat_response = ChatResponse(
             response=response,
             updated_history=updated_history,
         )
+        # Failed turns and turns that changed AWS resources must run again, not be replayed.
+        if is_replayable_turn(history[turn_start:]):
+            response_cache.set(cache_key, chat_response)
+        return chat_response
 
     except AWSAgentError as e:
         logger.error(f"AWS Agent error: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@app.post("/chat/stream", openapi_extra=CHAT_REQUEST_OPENAPI)
+@limiter.limit(RATE_LIMIT)
+async def chat_stream(
+    chat_request: Annotated[ChatRequest, Depends(parse_chat_request)], request: Request
+) -> StreamingResponse:
+    """Process a chat message, streaming the agent's response as server-sent events.
+
+    Each event carries a JSON object: ``{"delta": ...}`` for response text, then a
+    final ``{"done": true, "updated_history": [...]}`` or ``{"error": ...}``.
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Processing streaming chat request",
+            extra={"extra_data": {"client_ip": get_remote_address(request)}},
+        )
+
+    session_store: SessionStore = request.app.state.session_store
+    session_id = chat_request.session_id
+
+    history = await load_history(chat_request, session_store)
+    turn_start = len(history)
+    deltas: asyncio.Queue[str | None] = asyncio.Queue()
+
+    async def run_turn() -> str:
+        reply = ""
+        try:
+            # The slot is held by the turn, not the response, so it is only released once the
+            # agent has actually stopped, even if the client disconnected long before.
+            async with request.app.state.agent_slots:
+                async for delta in stream_request_async(chat_request.message, history):
+                    reply += delta
+                    deltas.put_nowait(delta)
+            if session_id:
+                await session_store.append(session_id, history[turn_start:])
+        finally:
+            deltas.put_nowait(None)
+        return reply
+
+    async def event_stream() -> AsyncIterator[bytes]:
+        # The turn runs in its own task rather than in the response body, so a client that
+        # disconnects mid-answer does not abandon AWS changes that are already under way or
+        # leave them out of the session history.
+        turn = asyncio.create_task(run_turn())
+        _running_turns.add(turn)
+        turn.add_done_callback(_finish_turn)
+
+        while (delta := await deltas.get()) is not None:
+            yield sse_event({"delta": delta})
+
+        try:
+            reply = await turn
+        except AWSAgentError as e:
+            yield sse_event({"error": str(e)})
+            return
+
+        if session_id:
+            updated_history = []
+        else:
+            updated_history = [
+                *CHAT_HISTORY_ADAPTER.dump_python(chat_request.history),
+                {"role": "user", "content": chat_request.message},
+                {"role": "assistant", "content": reply},
+            ]
+        yield sse_event({"done": True, "updated_history": updated_history})
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
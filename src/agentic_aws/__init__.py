@@ -1,22 +1,74 @@
 """Agentic AWS - AI-powered AWS infrastructure management."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-from agentic_aws.agent import AWSAgenticAgent
-from agentic_aws.cli import run_api, run_chat
-from agentic_aws.config import AWSConfig
-from agentic_aws.exceptions import AWSAgentError, AWSConnectionError, ToolExecutionError
-from agentic_aws.logging import get_logger, setup_logging
-from agentic_aws.models import (
-    AWSResourceInput,
-    ChatMessage,
-    ChatRequest,
-    ChatResponse,
-    CloudWatchResult,
-    OperationProgress,
-    OperationResult,
-)
-from agentic_aws.processor import get_agent, process_request
+if TYPE_CHECKING:
+    from agentic_aws.agent import AWSAgenticAgent
+    from agentic_aws.cache import ResponseCache
+    from agentic_aws.cli import run_api, run_chat
+    from agentic_aws.config import AWSConfig
+    from agentic_aws.exceptions import AWSAgentError, AWSConnectionError, ToolExecutionError
+    from agentic_aws.logging import get_logger, setup_logging
+    from agentic_aws.models import (
+        AWSResourceInput,
+        ChatMessage,
+        ChatRequest,
+        ChatResponse,
+        CloudWatchResult,
+        OperationProgress,
+        OperationResult,
+    )
+    from agentic_aws.processor import get_agent, process_request, process_request_async, stream_request_async
+    from agentic_aws.sessions import InMemorySessionStore, RedisSessionStore, create_session_store
+
+# Exports are imported on first access (PEP 562) so that importing the package, or
+# a light submodule such as agentic_aws.logging, does not pull in boto3 and anthropic.
+_LAZY_IMPORTS: dict[str, str] = {
+    "AWSAgenticAgent": "agentic_aws.agent",
+    "ResponseCache": "agentic_aws.cache",
+    "run_api": "agentic_aws.cli",
+    "run_chat": "agentic_aws.cli",
+    "AWSConfig": "agentic_aws.config",
+    "AWSAgentError": "agentic_aws.exceptions",
+    "AWSConnectionError": "agentic_aws.exceptions",
+    "ToolExecutionError": "agentic_aws.exceptions",
+    "get_logger": "agentic_aws.logging",
+    "setup_logging": "agentic_aws.logging",
+    "AWSResourceInput": "agentic_aws.models",
+    "ChatMessage": "agentic_aws.models",
+    "ChatRequest": "agentic_aws.models",
+    "ChatResponse": "agentic_aws.models",
+    "CloudWatchResult": "agentic_aws.models",
+    "OperationProgress": "agentic_aws.models",
+    "OperationResult": "agentic_aws.models",
+    "get_agent": "agentic_aws.processor",
+    "process_request": "agentic_aws.processor",
+    "process_request_async": "agentic_aws.processor",
+    "stream_request_async": "agentic_aws.processor",
+    "InMemorySessionStore": "agentic_aws.sessions",
+    "RedisSessionStore": "agentic_aws.sessions",
+    "create_session_store": "agentic_aws.sessions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
 
 __all__ = [
     "AWSAgenticAgent",
@@ -26,14 +78,20 @@ __all__ = [
     "AWSResourceInput",
     "ToolExecutionError",
     "ChatMessage",
+    "ResponseCache",
     "ChatRequest",
     "ChatResponse",
     "OperationProgress",
     "OperationResult",
     "CloudWatchResult",
+    "InMemorySessionStore",
+    "RedisSessionStore",
+    "create_session_store",
     "get_agent",
     "get_logger",
     "process_request",
+    "process_request_async",
+    "stream_request_async",
     "run_api",
     "run_chat",
     "setup_logging",
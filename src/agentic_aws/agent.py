@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
-import json
+import logging
 import os
+import threading
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, ClassVar, Literal
+from typing import TYPE_CHECKING, Any
 
 import anthropic
-from botocore.exceptions import ClientError
+import orjson
+from botocore.exceptions import ClientError, WaiterError
 from dotenv import load_dotenv
+from pydantic import TypeAdapter, ValidationError
 
 from agentic_aws.config import AWSConfig
 from agentic_aws.exceptions import AWSConnectionError, ToolExecutionError
@@ -21,6 +24,7 @@ from agentic_aws.models import (
     AWSResourceInput,
     CloudWatchResult,
     OperationProgress,
+    OperationProgressStatus,
     OperationResult,
 )
 from agentic_aws.prompts import ERROR_DIAGNOSIS_PROMPT, SUMMARY_PROMPT, SYSTEM_PROMPT
@@ -28,20 +32,140 @@ from agentic_aws.prompts import ERROR_DIAGNOSIS_PROMPT, SUMMARY_PROMPT, SYSTEM_P
 logger = get_logger(__name__)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+    from anthropic.types import ToolUseBlock
     from mypy_boto3_cloudcontrol import CloudControlApiClient
     from mypy_boto3_logs import CloudWatchLogsClient
+    from pydantic import BaseModel
 
 load_dotenv()
 
+# Upper bound on tool calls from a single model turn that run at the same time.
+MAX_PARALLEL_TOOLS = 8
+
+# Upper bound on summary and diagnosis calls to Anthropic in flight across all requests,
+# so parallel tool calls do not burst past the account's request rate limit.
+MAX_CONCURRENT_SUMMARIES = 4
+
+# Logs Insights query for the most recent Lambda errors, and how long to wait for it.
+LOGS_ERROR_QUERY = (
+    "fields @timestamp, @message, @logStream | filter @message like /ERROR/ | sort @timestamp desc | limit 10"
+)
+LOGS_QUERY_POLL_INTERVAL = 0.5
+LOGS_QUERY_TIMEOUT_SECONDS = 30
+
+# Growth factor and ceiling for the delay between Cloud Control operation status polls.
+OPERATION_POLL_BACKOFF = 1.5
+OPERATION_POLL_MAX_DELAY = 30.0
+
+# One HTTP/2 connection pool shared by every agent, so concurrent turns and tool summaries
+# multiplex over warm connections instead of each opening its own TLS session. The SDK's
+# default pool limits are kept; turns are streamed, so the read timeout applies per chunk.
+ANTHROPIC_HTTP_CLIENT = anthropic.DefaultHttpxClient(http2=True, timeout=anthropic.Timeout(60.0, connect=5.0))
+
+# Validates aws_cloud_control tool input straight from the dict the model sent.
+_AWS_INPUT_ADAPTER = TypeAdapter(AWSResourceInput)
+
+# Marks the end of a prompt prefix that Anthropic may cache and reuse across requests.
+CACHE_CONTROL: dict[str, str] = {"type": "ephemeral"}
+
+# Tool definitions are parsed once at import and shared by every agent instance. The last
+# definition carries a cache breakpoint, so the whole tools array is served from the prompt cache.
+_tool_definitions: list[dict[str, Any]] = orjson.loads((Path(__file__).parent / "tools.json").read_bytes())
+TOOLS: tuple[dict[str, Any], ...] = (
+    *_tool_definitions[:-1],
+    {**_tool_definitions[-1], "cache_control": CACHE_CONTROL},
+)
+
+# The system prompt as a content block marked for prompt caching.
+SYSTEM_BLOCKS: tuple[dict[str, Any], ...] = ({"type": "text", "text": SYSTEM_PROMPT, "cache_control": CACHE_CONTROL},)
+
+
+def _dumps(value: Any, *, indent: bool = False) -> str:
+    """Serialize a value to a JSON string with orjson."""
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else None).decode()
+
+
+def _parse_properties(resources: Sequence[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    """Parse the Properties JSON of every listed resource in a single orjson call."""
+    parsed: list[dict[str, Any]] = orjson.loads("[" + ",".join(r.get("Properties") or "{}" for r in resources) + "]")
+    return parsed
+
+
+def _error_details(error: ClientError) -> tuple[str, str | None]:
+    """Return the message and code of an AWS client error."""
+    details = error.response.get("Error") or {}
+    return details.get("Message") or str(error), details.get("Code")
+
+
+def _request_id(response: Mapping[str, Any]) -> str:
+    """Return the AWS request id of a response as JSON, for tracing unexpected responses."""
+    return _dumps({"RequestId": response.get("ResponseMetadata", {}).get("RequestId")})
+
+
+def _result(model: type[BaseModel], **fields: Any) -> dict[str, Any]:
+    """Build a result dict with the same keys as model(**fields).model_dump().
+
+    The agent builds its results from values it controls, so this skips Pydantic
+    validation and serialization. Every optional field of the result models
+    defaults to None.
+    """
+    result = dict.fromkeys(model.model_fields)
+    result.update(fields)
+    return result
+
+
+def _with_cache_breakpoint(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return messages with a cache breakpoint on the last content block.
+
+    Each agent turn resends the whole conversation, so marking its end lets the next
+    turn read everything before it from the prompt cache. The history itself is left
+    untouched because it is stored and returned to clients.
+    """
+    if not messages:
+        return messages
+
+    last = messages[-1]
+    content = last["content"]
+    if isinstance(content, str):
+        blocks = [{"type": "text", "text": content, "cache_control": CACHE_CONTROL}]
+    else:
+        blocks = [*content[:-1], {**content[-1], "cache_control": CACHE_CONTROL}]
+    return [*messages[:-1], {**last, "content": blocks}]
+
+
+def _replace_patch_document(properties: Mapping[str, Any]) -> str:
+    """Build a JSON Patch that replaces each property, writing the JSON text directly.
+
+    Every operation has the same shape, so only the path and value need encoding.
+    Keys are escaped as JSON Pointer tokens (RFC 6901).
+    """
+    operations = (
+        b'{"op":"replace","path":'
+        + orjson.dumps("/" + key.replace("~", "~0").replace("/", "~1"))
+        + b',"value":'
+        + orjson.dumps(value)
+        + b"}"
+        for key, value in properties.items()
+    )
+    return (b"[" + b",".join(operations) + b"]").decode()
+
 
 class AWSAgenticAgent:
     """AI-powered agent for managing AWS infrastructure through natural language."""
 
-    _tools: ClassVar[list[dict[str, Any]] | None] = None
+    def __init__(self, summarize: bool = False) -> None:
+        """Create the agent.
 
-    def __init__(self) -> None:
-        self.client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        Args:
+            summarize: Ask Claude for a separate summary of each tool result instead of
+                leaving the explanation to the next agent turn
+        """
+        self.client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"), http_client=ANTHROPIC_HTTP_CLIENT)
         self.aws_config = AWSConfig()
+        self.summarize = summarize
+        self._summary_slots = threading.BoundedSemaphore(MAX_CONCURRENT_SUMMARIES)
         self._test_aws_connection()
 
     def _test_aws_connection(self) -> None:
@@ -54,19 +178,9 @@ class AWSAgenticAgent:
         logger.info("AWS connection successful")
         logger.info("Anthropic connection will be tested on first use")
 
-    def _build_system_prompt(self) -> str:
-        """Build system prompt for AWS operations."""
-        return SYSTEM_PROMPT
-
-    def _format_tools(self) -> list[dict[str, Any]]:
-        """Load and cache tool definitions from JSON file."""
-        if AWSAgenticAgent._tools is not None:
-            return AWSAgenticAgent._tools
-
-        json_path = Path(__file__).parent / "tools.json"
-        AWSAgenticAgent._tools = json.loads(json_path.read_text())
-
-        return AWSAgenticAgent._tools
+    def _format_tools(self) -> tuple[dict[str, Any], ...]:
+        """Return the tool definitions loaded from tools.json."""
+        return TOOLS
 
     def _execute_aws_operation(
         self,
@@ -80,13 +194,13 @@ class AWSAgenticAgent:
     ) -> dict[str, Any]:
         """Execute AWS Cloud Control API operation."""
         try:
-            session = self.aws_config.get_session()
-            cloudcontrol: CloudControlApiClient = session.client("cloudcontrol", region_name=region)
+            cloudcontrol: CloudControlApiClient = self.aws_config.get_client("cloudcontrol", region)
 
-            logger.info(
-                f"Executing {operation} on {resource_type}",
-                extra={"extra_data": {"properties": properties, "region": region}},
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Executing {operation} on {resource_type}",
+                    extra={"extra_data": {"properties": properties, "region": region}},
+                )
 
             if operation == "create":
                 return self._handle_create_operation(cloudcontrol, resource_type, properties)
@@ -104,30 +218,45 @@ class AWSAgenticAgent:
                 return self._handle_delete_operation(cloudcontrol, resource_type, identifier)
 
             if operation in ("read", "update", "delete") and not identifier:
-                return OperationResult(
+                return _result(
+                    OperationResult,
                     status="error",
                     operation=operation,
                     resource_type=resource_type,
                     error=f"Operation '{operation}' requires an identifier",
-                ).model_dump()
+                )
 
-            return OperationResult(
+            return _result(
+                OperationResult,
                 status="error",
                 operation=operation,
                 resource_type=resource_type,
                 error=f"Unknown operation: {operation}",
-            ).model_dump()
+            )
 
         except ClientError as e:
-            error_message = e.response.get("Error", {}).get("Message", str(e))
-            logger.error(f"AWS Operation Error: {error_message}")
-            return OperationResult(
-                status="error",
-                operation=operation,
-                resource_type=resource_type,
-                error=f"AWS API error: {error_message}",
-                aws_error=str(e),
-            ).model_dump()
+            return self._client_error(operation, resource_type, e, "AWS API error")
+
+    def _client_error(
+        self,
+        operation: str,
+        resource_type: str,
+        error: ClientError,
+        summary: str,
+        identifier: str | None = None,
+    ) -> dict[str, Any]:
+        """Log an AWS client error and return it as an error result."""
+        error_message, _ = _error_details(error)
+        logger.error(f"{summary}: {error_message}")
+        return _result(
+            OperationResult,
+            status="error",
+            operation=operation,
+            resource_type=resource_type,
+            identifier=identifier,
+            error=f"{summary}: {error_message}",
+            aws_error=str(error),
+        )
 
     def _handle_create_operation(
         self,
@@ -139,48 +268,42 @@ class AWSAgenticAgent:
         try:
             response = cloudcontrol.create_resource(
                 TypeName=resource_type,
-                DesiredState=json.dumps(properties) if properties else "{}",
+                DesiredState=_dumps(properties) if properties else "{}",
             )
-            logger.debug(f"AWS Response: {response}")
+            logger.debug("AWS Response: %s", response)
 
             if "ProgressEvent" not in response:
-                return OperationResult(
+                return _result(
+                    OperationResult,
                     status="error",
                     operation="create",
                     resource_type=resource_type,
                     error="Invalid response from AWS Cloud Control API",
-                    aws_response=str(response),
-                ).model_dump()
+                    aws_response=_request_id(response),
+                )
 
             request_token = response.get("ProgressEvent", {}).get("RequestToken")
             if not request_token:
-                return OperationResult(
+                return _result(
+                    OperationResult,
                     status="error",
                     operation="create",
                     resource_type=resource_type,
                     error="No request token received from AWS",
-                    aws_response=str(response),
-                ).model_dump()
+                    aws_response=_request_id(response),
+                )
 
-            return OperationResult(
+            return _result(
+                OperationResult,
                 status="success",
                 operation="create",
                 resource_type=resource_type,
                 request_token=request_token,
                 message=f"Creating {resource_type}...",
-                aws_response=str(response),
-            ).model_dump()
+            )
 
         except ClientError as e:
-            error_message = e.response.get("Error", {}).get("Message", str(e))
-            logger.error(f"Create Resource Error: {error_message}")
-            return OperationResult(
-                status="error",
-                operation="create",
-                resource_type=resource_type,
-                error=f"Failed to create resource: {error_message}",
-                aws_error=str(e),
-            ).model_dump()
+            return self._client_error("create", resource_type, e, "Failed to create resource")
 
     def _handle_list_operation(
         self,
@@ -199,32 +322,24 @@ class AWSAgenticAgent:
                 params["NextToken"] = next_token
 
             response = cloudcontrol.list_resources(**params)
-            logger.debug(f"List Response: {response}")
+            logger.debug("List Response: %s", response)
 
             resources = response.get("ResourceDescriptions", [])
             response_next_token = response.get("NextToken")
 
-            return OperationResult(
+            return _result(
+                OperationResult,
                 status="success",
                 operation="list",
                 resource_type=resource_type,
                 count=len(resources),
-                resources=[json.loads(r.get("Properties", "{}")) for r in resources],
+                resources=_parse_properties(resources),
                 next_token=response_next_token,
                 message=f"Retrieved {len(resources)} resources" + (" (more available)" if response_next_token else ""),
-                aws_response=str(response),
-            ).model_dump()
+            )
 
         except ClientError as e:
-            error_message = e.response.get("Error", {}).get("Message", str(e))
-            logger.error(f"List Resources Error: {error_message}")
-            return OperationResult(
-                status="error",
-                operation="list",
-                resource_type=resource_type,
-                error=f"Failed to list resources: {error_message}",
-                aws_error=str(e),
-            ).model_dump()
+            return self._client_error("list", resource_type, e, "Failed to list resources")
 
     def _handle_read_operation(
         self,
@@ -238,28 +353,19 @@ class AWSAgenticAgent:
                 TypeName=resource_type,
                 Identifier=identifier,
             )
-            logger.debug(f"Read Response: {response}")
+            logger.debug("Read Response: %s", response)
 
-            return OperationResult(
+            return _result(
+                OperationResult,
                 status="success",
                 operation="read",
                 resource_type=resource_type,
                 identifier=identifier,
-                properties=json.loads(response["ResourceDescription"]["Properties"]),
-                aws_response=str(response),
-            ).model_dump()
+                properties=orjson.loads(response["ResourceDescription"]["Properties"]),
+            )
 
         except ClientError as e:
-            error_message = e.response.get("Error", {}).get("Message", str(e))
-            logger.error(f"Read Resource Error: {error_message}")
-            return OperationResult(
-                status="error",
-                operation="read",
-                resource_type=resource_type,
-                identifier=identifier,
-                error=f"Failed to read resource: {error_message}",
-                aws_error=str(e),
-            ).model_dump()
+            return self._client_error("read", resource_type, e, "Failed to read resource", identifier=identifier)
 
     def _handle_update_operation(
         self,
@@ -271,56 +377,47 @@ class AWSAgenticAgent:
         """Handle resource update operation using patch document."""
         try:
             if not properties:
-                return OperationResult(
+                return _result(
+                    OperationResult,
                     status="error",
                     operation="update",
                     resource_type=resource_type,
                     identifier=identifier,
                     error="Properties are required for update operations",
-                ).model_dump()
-
-            patch_document = [{"op": "replace", "path": f"/{key}", "value": value} for key, value in properties.items()]
+                )
 
             response = cloudcontrol.update_resource(
                 TypeName=resource_type,
                 Identifier=identifier,
-                PatchDocument=json.dumps(patch_document),
+                PatchDocument=_replace_patch_document(properties),
             )
-            logger.debug(f"Update Response: {response}")
+            logger.debug("Update Response: %s", response)
 
             if "ProgressEvent" not in response:
-                return OperationResult(
+                return _result(
+                    OperationResult,
                     status="error",
                     operation="update",
                     resource_type=resource_type,
                     identifier=identifier,
                     error="Invalid response from AWS Cloud Control API",
-                    aws_response=str(response),
-                ).model_dump()
+                    aws_response=_request_id(response),
+                )
 
             request_token = response.get("ProgressEvent", {}).get("RequestToken")
 
-            return OperationResult(
+            return _result(
+                OperationResult,
                 status="success",
                 operation="update",
                 resource_type=resource_type,
                 identifier=identifier,
                 request_token=request_token,
                 message=f"Updating {resource_type} ({identifier})...",
-                aws_response=str(response),
-            ).model_dump()
+            )
 
         except ClientError as e:
-            error_message = e.response.get("Error", {}).get("Message", str(e))
-            logger.error(f"Update Resource Error: {error_message}")
-            return OperationResult(
-                status="error",
-                operation="update",
-                resource_type=resource_type,
-                identifier=identifier,
-                error=f"Failed to update resource: {error_message}",
-                aws_error=str(e),
-            ).model_dump()
+            return self._client_error("update", resource_type, e, "Failed to update resource", identifier=identifier)
 
     def _handle_delete_operation(
         self,
@@ -334,41 +431,33 @@ class AWSAgenticAgent:
                 TypeName=resource_type,
                 Identifier=identifier,
             )
-            logger.debug(f"Delete Response: {response}")
+            logger.debug("Delete Response: %s", response)
 
             if "ProgressEvent" not in response:
-                return OperationResult(
+                return _result(
+                    OperationResult,
                     status="error",
                     operation="delete",
                     resource_type=resource_type,
                     identifier=identifier,
                     error="Invalid response from AWS Cloud Control API",
-                    aws_response=str(response),
-                ).model_dump()
+                    aws_response=_request_id(response),
+                )
 
             request_token = response.get("ProgressEvent", {}).get("RequestToken")
 
-            return OperationResult(
+            return _result(
+                OperationResult,
                 status="success",
                 operation="delete",
                 resource_type=resource_type,
                 identifier=identifier,
                 request_token=request_token,
                 message=f"Deleting {resource_type} ({identifier})...",
-                aws_response=str(response),
-            ).model_dump()
+            )
 
         except ClientError as e:
-            error_message = e.response.get("Error", {}).get("Message", str(e))
-            logger.error(f"Delete Resource Error: {error_message}")
-            return OperationResult(
-                status="error",
-                operation="delete",
-                resource_type=resource_type,
-                identifier=identifier,
-                error=f"Failed to delete resource: {error_message}",
-                aws_error=str(e),
-            ).model_dump()
+            return self._client_error("delete", resource_type, e, "Failed to delete resource", identifier=identifier)
 
     def _poll_operation_status(
         self,
@@ -377,7 +466,11 @@ class AWSAgenticAgent:
         max_wait_seconds: int = 120,
         initial_delay: float = 2.0,
     ) -> OperationProgress:
-        """Poll Cloud Control API for operation completion with exponential backoff.
+        """Wait for a Cloud Control API operation to finish, backing off between polls.
+
+        Each poll is a single attempt of the service's resource_request_success waiter, which
+        classifies the status; the delay between polls grows by OPERATION_POLL_BACKOFF up to
+        OPERATION_POLL_MAX_DELAY, which a waiter's fixed Delay cannot express.
 
         Args:
             request_token: The request token from the async operation
@@ -388,101 +481,168 @@ class AWSAgenticAgent:
         Returns:
             OperationProgress with current status
         """
-        session = self.aws_config.get_session()
-        cloudcontrol: CloudControlApiClient = session.client("cloudcontrol", region_name=region)
+        cloudcontrol: CloudControlApiClient = self.aws_config.get_client("cloudcontrol", region)
+        waiter = cloudcontrol.get_waiter("resource_request_success")
 
         delay = initial_delay
-        max_delay = 30.0
         elapsed = 0.0
+        progress_event: Mapping[str, Any] = {}
 
-        while elapsed < max_wait_seconds:
-            try:
-                response = cloudcontrol.get_resource_request_status(RequestToken=request_token)
-                progress_event = response.get("ProgressEvent", {})
-                operation_status: Literal[
-                    "PENDING", "IN_PROGRESS", "SUCCESS", "FAILED", "CANCEL_IN_PROGRESS", "CANCEL_COMPLETE"
-                ] = progress_event.get("OperationStatus", "PENDING")
+        try:
+            while elapsed < max_wait_seconds:
+                try:
+                    waiter.wait(RequestToken=request_token, WaiterConfig={"MaxAttempts": 1})
+                except WaiterError as e:
+                    last_response: Mapping[str, Any] = e.last_response or {}
+
+                    if "Error" in last_response:
+                        error = last_response["Error"]
+                        error_message = error.get("Message", str(e))
+                        logger.error(f"Error polling operation status: {error_message}")
+                        return OperationProgress.model_construct(
+                            request_token=request_token,
+                            operation_status="FAILED",
+                            resource_type="",
+                            status_message=f"Failed to poll status: {error_message}",
+                            error_code=error.get("Code"),
+                        )
 
-                logger.info(
-                    f"Operation status: {operation_status}",
-                    extra={"extra_data": {"request_token": request_token}},
-                )
+                    progress_event = last_response.get("ProgressEvent", {})
+                    if progress_event.get("OperationStatus") in ("FAILED", "CANCEL_COMPLETE"):
+                        return self._build_operation_progress(request_token, progress_event)
 
-                if operation_status in ("SUCCESS", "FAILED", "CANCEL_COMPLETE"):
-                    return OperationProgress(
-                        request_token=request_token,
-                        operation_status=operation_status,
-                        resource_type=progress_event.get("TypeName", ""),
-                        identifier=progress_event.get("Identifier"),
-                        status_message=progress_event.get("StatusMessage"),
-                        error_code=progress_event.get("ErrorCode"),
-                    )
-
-                time.sleep(delay)
-                elapsed += delay
-                delay = min(delay * 1.5, max_delay)
-
-            except ClientError as e:
-                error_message = e.response.get("Error", {}).get("Message", str(e))
-                logger.error(f"Error polling operation status: {error_message}")
-                return OperationProgress(
-                    request_token=request_token,
-                    operation_status="FAILED",
-                    resource_type="",
-                    status_message=f"Failed to poll status: {error_message}",
-                    error_code=e.response.get("Error", {}).get("Code"),
-                )
+                    time.sleep(delay)
+                    elapsed += delay
+                    delay = min(delay * OPERATION_POLL_BACKOFF, OPERATION_POLL_MAX_DELAY)
+                    continue
 
-        return OperationProgress(
+                # The waiter does not return the final response, so read the completed event once.
+                response = cloudcontrol.get_resource_request_status(RequestToken=request_token)
+                return self._build_operation_progress(request_token, response.get("ProgressEvent", {}))
+
+        except ClientError as e:
+            error_message, error_code = _error_details(e)
+            logger.error(f"Error polling operation status: {error_message}")
+            return OperationProgress.model_construct(
+                request_token=request_token,
+                operation_status="FAILED",
+                resource_type="",
+                status_message=f"Failed to poll status: {error_message}",
+                error_code=error_code,
+            )
+
+        return OperationProgress.model_construct(
             request_token=request_token,
             operation_status="IN_PROGRESS",
-            resource_type="",
+            resource_type=progress_event.get("TypeName", ""),
             status_message=f"Operation still in progress after {max_wait_seconds}s",
             retry_after=int(delay),
         )
 
+    def _build_operation_progress(self, request_token: str, progress_event: Mapping[str, Any]) -> OperationProgress:
+        """Build an OperationProgress from a Cloud Control ProgressEvent.
+
+        Progress values come from Cloud Control or from this module, so the model is
+        constructed without validation, as _result does for the other results.
+        """
+        operation_status: OperationProgressStatus = progress_event.get("OperationStatus", "PENDING")
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Operation status: {operation_status}",
+                extra={"extra_data": {"request_token": request_token}},
+            )
+
+        return OperationProgress.model_construct(
+            request_token=request_token,
+            operation_status=operation_status,
+            resource_type=progress_event.get("TypeName", ""),
+            identifier=progress_event.get("Identifier"),
+            status_message=progress_event.get("StatusMessage"),
+            error_code=progress_event.get("ErrorCode"),
+        )
+
     def _query_cloudwatch_logs(self, function_name: str, hours_back: int = 1) -> dict[str, Any]:
-        """Query CloudWatch Logs for Lambda function errors."""
+        """Query CloudWatch Logs for Lambda function errors with Logs Insights.
+
+        The query filters, sorts and limits on the server, so only the rows that are
+        returned cross the network; the match count comes from the query statistics.
+        """
         try:
-            session = self.aws_config.get_session()
-            logs_client: CloudWatchLogsClient = session.client("logs")
+            logs_client: CloudWatchLogsClient = self.aws_config.get_client("logs")
 
-            end_time = datetime.now()
-            start_time = end_time - timedelta(hours=hours_back)
+            # Logs Insights takes epoch seconds, so the window is computed without datetime objects.
+            end_time = int(time.time())
+            start_time = end_time - hours_back * 3600
 
             log_group_name = f"/aws/lambda/{function_name}"
 
-            response = logs_client.filter_log_events(
+            query = logs_client.start_query(
                 logGroupName=log_group_name,
-                startTime=int(start_time.timestamp() * 1000),
-                endTime=int(end_time.timestamp() * 1000),
-                filterPattern="ERROR",
+                startTime=start_time,
+                endTime=end_time,
+                queryString=LOGS_ERROR_QUERY,
             )
+            query_id = query["queryId"]
+
+            deadline = time.monotonic() + LOGS_QUERY_TIMEOUT_SECONDS
+            while True:
+                response = logs_client.get_query_results(queryId=query_id)
+                status = response["status"]
+                if status not in ("Scheduled", "Running"):
+                    break
+                if time.monotonic() >= deadline:
+                    logs_client.stop_query(queryId=query_id)
+                    status = "Timeout"
+                    break
+                time.sleep(LOGS_QUERY_POLL_INTERVAL)
+
+            if status != "Complete":
+                return _result(
+                    CloudWatchResult,
+                    status="error",
+                    function_name=function_name,
+                    error=f"Logs Insights query ended with status {status}",
+                )
 
             error_logs = [
                 {
-                    "timestamp": datetime.fromtimestamp(event["timestamp"] / 1000).isoformat(),
-                    "message": event["message"],
-                    "logStreamName": event["logStreamName"],
+                    "timestamp": fields.get("@timestamp"),
+                    "message": fields.get("@message"),
+                    "logStreamName": fields.get("@logStream"),
                 }
-                for event in response.get("events", [])
+                for fields in ({f["field"]: f["value"] for f in row} for row in response.get("results", []))
             ]
+            statistics = response.get("statistics", {})
 
-            return CloudWatchResult(
+            return _result(
+                CloudWatchResult,
                 status="success",
                 function_name=function_name,
                 hours_back=hours_back,
-                error_count=len(error_logs),
-                error_logs=error_logs[:10],
-            ).model_dump()
+                error_count=int(statistics.get("recordsMatched", len(error_logs))),
+                error_logs=error_logs,
+            )
 
         except ClientError as e:
-            error_message = e.response.get("Error", {}).get("Message", str(e))
-            return CloudWatchResult(
+            error_message, _ = _error_details(e)
+            return _result(
+                CloudWatchResult,
                 status="error",
                 function_name=function_name,
                 error=error_message,
-            ).model_dump()
+            )
+
+    def _complete_short(self, prompt: str) -> str:
+        """Run a short single-prompt completion, waiting for a free summary slot first."""
+        with self._summary_slots:
+            response = self.client.messages.create(
+                model="claude-3-5-sonnet-latest",
+                max_tokens=500,
+                messages=[{"role": "user", "content": prompt}],
+            )
+
+        return response.content[0].text  # type: ignore[union-attr]
 
     def _diagnose_error(
         self,
@@ -510,13 +670,7 @@ class AWSAgenticAgent:
                 error_code=error_code or "Not provided",
             )
 
-            response = self.client.messages.create(
-                model="claude-3-5-sonnet-latest",
-                max_tokens=500,
-                messages=[{"role": "user", "content": diagnosis_prompt}],
-            )
-
-            return response.content[0].text  # type: ignore[union-attr]
+            return self._complete_short(diagnosis_prompt)
 
         except (anthropic.APIConnectionError, anthropic.APIStatusError) as e:
             logger.warning(f"Failed to diagnose error: {e}")
@@ -535,32 +689,39 @@ class AWSAgenticAgent:
         try:
             summary_prompt = SUMMARY_PROMPT.format(
                 tool_name=tool_name,
-                tool_result=json.dumps(tool_result, indent=2),
+                tool_result=_dumps(tool_result, indent=True),
                 user_question=user_question,
             )
 
-            response = self.client.messages.create(
-                model="claude-3-5-sonnet-latest",
-                max_tokens=500,
-                messages=[{"role": "user", "content": summary_prompt}],
-            )
-
-            return response.content[0].text  # type: ignore[union-attr]
+            return self._complete_short(summary_prompt)
 
         except anthropic.APIConnectionError as e:
             raise ToolExecutionError(f"Failed to connect to Anthropic API: {e}") from e
         except anthropic.APIStatusError as e:
             raise ToolExecutionError(f"Anthropic API error: {e.message}") from e
 
-    def _execute_tool(self, tool_name: str, tool_input: dict[str, Any], user_input: str) -> tuple[dict[str, Any], str]:
-        """Execute a tool and return the result and formatted output.
+    def _execute_tool(self, tool_name: str, tool_input: dict[str, Any], user_input: str) -> tuple[str, str]:
+        """Execute a tool and return the serialized result and formatted output.
+
+        The raw result goes back to Claude as a tool_result, and the next model turn
+        explains it (including any error), so no separate summary call is made unless
+        the agent was created with summarize=True.
 
         Returns:
-            Tuple of (tool_result_dict, formatted_response_content)
+            Tuple of (tool_result_json, formatted_response_content)
         """
         if tool_name == "aws_cloud_control":
             try:
-                validated_input = AWSResourceInput(**tool_input)
+                validated_input = _AWS_INPUT_ADAPTER.validate_python(tool_input)
+            except ValidationError as e:
+                result = _result(
+                    OperationResult,
+                    status="error",
+                    operation=tool_input.get("operation", "unknown"),
+                    resource_type=tool_input.get("resource_type", "unknown"),
+                    error=f"Validation error: {e}",
+                )
+            else:
                 result = self._execute_aws_operation(
                     operation=validated_input.operation,
                     resource_type=validated_input.resource_type,
@@ -570,28 +731,27 @@ class AWSAgenticAgent:
                     max_results=validated_input.max_results,
                     next_token=validated_input.next_token,
                 )
-            except ValueError as e:
-                result = OperationResult(
-                    status="error",
-                    operation=tool_input.get("operation", "unknown"),
-                    resource_type=tool_input.get("resource_type", "unknown"),
-                    error=f"Validation error: {e}",
-                ).model_dump()
-            summary = self._generate_summary(tool_name, result, user_input)
-            return result, f"\n\nAI Summary:\n{summary}"
+            formatted_output = ""
 
-        if tool_name == "cloudwatch_logs":
+        elif tool_name == "cloudwatch_logs":
             result = self._query_cloudwatch_logs(**tool_input)
+            formatted_output = f"\n\nCloudWatch Logs Result:\n{_dumps(result, indent=True)}"
+
+        else:
+            return _dumps({"error": f"Unknown tool: {tool_name}"}), f"\n\nError: Unknown tool '{tool_name}'"
+
+        if self.summarize:
             summary = self._generate_summary(tool_name, result, user_input)
-            return result, f"\n\nCloudWatch Logs Result:\n{json.dumps(result, indent=2)}\n\nAI Summary:\n{summary}"
+            formatted_output += f"\n\nAI Summary:\n{summary}"
 
-        return {"error": f"Unknown tool: {tool_name}"}, f"\n\nError: Unknown tool '{tool_name}'"
+        return _dumps(result), formatted_output
 
     def process_request(
         self,
         user_input: str,
         history: list[dict[str, str]],
         max_iterations: int = 10,
+        on_text: Callable[[str], None] | None = None,
     ) -> str:
         """Process a user request using an agentic loop until completion.
 
@@ -599,10 +759,17 @@ class AWSAgenticAgent:
             user_input: The user's message
             history: Conversation history (modified in place)
             max_iterations: Maximum number of agent turns before stopping
+            on_text: Optional callback invoked with each piece of text as soon as it is produced
 
         Returns:
             The agent's final response
         """
+
+        def emit(text: str) -> str:
+            if on_text is not None:
+                on_text(text)
+            return text
+
         history.append({"role": "user", "content": user_input})
         final_response = ""
         iteration = 0
@@ -612,53 +779,65 @@ class AWSAgenticAgent:
                 iteration += 1
                 logger.info(f"Agent iteration {iteration}/{max_iterations}")
 
-                response = self.client.messages.create(
-                    model="claude-3-5-sonnet-latest",
-                    max_tokens=2000,
-                    system=self._build_system_prompt(),
-                    messages=history,  # type: ignore[arg-type]
-                    tools=self._format_tools(),  # type: ignore[arg-type]
-                )
-
                 assistant_content: list[dict[str, Any]] = []
                 tool_results: list[dict[str, Any]] = []
+                pending_tools: list[tuple[ToolUseBlock, Future[tuple[str, str]]]] = []
                 response_text = ""
 
-                for content_block in response.content:
-                    if content_block.type == "text":
-                        logger.debug("Received TEXT response from LLM")
-                        response_text += content_block.text
-                        assistant_content.append(
-                            {
-                                "type": "text",
-                                "text": content_block.text,
-                            }
-                        )
-
-                    elif content_block.type == "tool_use":
-                        logger.info(
-                            f"Received tool use request: {content_block.name}",
-                            extra={"extra_data": {"tool_input": content_block.input}},
-                        )
-
-                        tool_input: dict[str, Any] = content_block.input
-                        result, formatted_output = self._execute_tool(content_block.name, tool_input, user_input)
-                        response_text += formatted_output
-
-                        assistant_content.append(
-                            {
-                                "type": "tool_use",
-                                "id": content_block.id,
-                                "name": content_block.name,
-                                "input": content_block.input,
-                            }
-                        )
-
+                # Each tool starts as soon as its block has finished streaming, so AWS calls
+                # overlap with the rest of the model's output.
+                with (
+                    ThreadPoolExecutor(max_workers=MAX_PARALLEL_TOOLS) as executor,
+                    self.client.messages.stream(
+                        model="claude-3-5-sonnet-latest",
+                        max_tokens=2000,
+                        system=SYSTEM_BLOCKS,  # type: ignore[arg-type]
+                        messages=_with_cache_breakpoint(history),  # type: ignore[arg-type]
+                        tools=self._format_tools(),  # type: ignore[arg-type]
+                    ) as stream,
+                ):
+                    for event in stream:
+                        if event.type == "text":
+                            response_text += emit(event.text)
+
+                        elif event.type == "content_block_stop" and event.content_block.type == "tool_use":
+                            tool_block = event.content_block
+                            if logger.isEnabledFor(logging.INFO):
+                                logger.info(
+                                    f"Received tool use request: {tool_block.name}",
+                                    extra={"extra_data": {"tool_input": tool_block.input}},
+                                )
+                            future = executor.submit(
+                                self._execute_tool,
+                                tool_block.name,
+                                tool_block.input,
+                                user_input,
+                            )
+                            pending_tools.append((tool_block, future))
+
+                    response = stream.get_final_message()
+
+                    for content_block in response.content:
+                        if content_block.type == "text":
+                            assistant_content.append({"type": "text", "text": content_block.text})
+                        elif content_block.type == "tool_use":
+                            assistant_content.append(
+                                {
+                                    "type": "tool_use",
+                                    "id": content_block.id,
+                                    "name": content_block.name,
+                                    "input": content_block.input,
+                                }
+                            )
+
+                    for tool_block, future in pending_tools:
+                        result_json, formatted_output = future.result()
+                        response_text += emit(formatted_output)
                         tool_results.append(
                             {
                                 "type": "tool_result",
-                                "tool_use_id": content_block.id,
-                                "content": json.dumps(result),
+                                "tool_use_id": tool_block.id,
+                                "content": result_json,
                             }
                         )
 
@@ -679,15 +858,15 @@ class AWSAgenticAgent:
 
             if iteration >= max_iterations:
                 logger.warning(f"Agent reached max iterations ({max_iterations})")
-                final_response += "\n\n(Note: Maximum processing steps reached)"
+                final_response += emit("\n\n(Note: Maximum processing steps reached)")
 
             return final_response
 
         except anthropic.APIConnectionError as e:
             error_msg = f"Error: Failed to connect to Anthropic API: {e}"
             logger.error(error_msg)
-            return error_msg
+            return emit(error_msg)
         except anthropic.APIStatusError as e:
             error_msg = f"Error: Anthropic API error: {e.message}"
             logger.error(error_msg)
-            return error_msg
+            return emit(error_msg)
@@ -0,0 +1,95 @@
+"""In-process response cache for repeated chat requests."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from agentic_aws.models import ChatResponse
+
+# Tool operations whose effects a replayed reply would silently skip.
+MUTATING_OPERATIONS = frozenset({"create", "update", "delete"})
+
+
+def is_replayable_turn(turn: list[dict[str, Any]]) -> bool:
+    """Whether an agent turn may be answered again from the cache.
+
+    A turn qualifies only when the agent produced a final reply (Anthropic failures
+    leave none), every tool call succeeded, and no tool call changed AWS resources.
+
+    Args:
+        turn: The messages the agent appended to the history for this request
+    """
+    if not turn or turn[-1].get("role") != "assistant":
+        return False
+
+    for message in turn:
+        content = message.get("content")
+        if not isinstance(content, list):
+            continue
+        for block in content:
+            if block.get("type") == "tool_use" and block.get("input", {}).get("operation") in MUTATING_OPERATIONS:
+                return False
+            if block.get("type") == "tool_result" and json.loads(block["content"]).get("status") != "success":
+                return False
+    return True
+
+
+class ResponseCache:
+    """TTL cache of chat responses keyed by the message and conversation state.
+
+    A hit is only possible when the message, the scope and the history given to
+    make_key all match, so retried or duplicated submissions skip the LLM and AWS
+    round-trips. Callers must key on everything the cached response depends on or
+    echoes back, or one conversation could be answered with another's response.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 256) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, ChatResponse]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is turned on."""
+        return self.ttl_seconds > 0
+
+    @staticmethod
+    def make_key(message: str, history: list[dict[str, Any]], scope: str = "") -> str:
+        """Build a cache key from the message and the history it was sent with.
+
+        Args:
+            message: The user's message
+            history: Conversation history the message was sent with
+            scope: Keeps entries apart that must not answer each other, e.g. a session id
+        """
+        payload = json.dumps([scope, message, history], separators=(",", ":"), sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> ChatResponse | None:
+        """Return the cached response for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    def set(self, key: str, response: ChatResponse) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        if not self.enabled:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -1,14 +1,21 @@
 """CLI entry points for agentic-aws."""
 
+import os
 import subprocess
 import sys
 from pathlib import Path
 
 
 def run_api() -> None:
-    """Run the FastAPI server."""
+    """Run the FastAPI server.
+
+    Runs with auto-reload by default; setting WORKERS above 1 starts that many
+    worker processes instead. uvicorn picks uvloop and httptools when installed.
+    """
+    workers = int(os.getenv("WORKERS", "1"))
+    mode_args = ["--workers", str(workers)] if workers > 1 else ["--reload"]
     subprocess.run(
-        [sys.executable, "-m", "uvicorn", "main:app", "--reload", "--port", "8000"],
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", "8000", *mode_args],
         cwd=Path(__file__).parent.parent.parent,
         check=False,
     )
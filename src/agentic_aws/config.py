@@ -1,8 +1,12 @@
 """AWS session configuration and connection management."""
 
 import os
+import threading
+from typing import Any
 
 import boto3
+import botocore.loaders
+import botocore.session
 from botocore.exceptions import ClientError, NoCredentialsError
 from dotenv import load_dotenv
 
@@ -13,6 +17,9 @@ load_dotenv()
 
 logger = get_logger(__name__)
 
+# Service models and endpoint data are read from disk once and shared by every session.
+_LOADER = botocore.loaders.create_loader()
+
 
 class AWSConfig:
     """Manages AWS session configuration and connection validation."""
@@ -21,14 +28,40 @@ class AWSConfig:
         self.access_key: str | None = os.getenv("AWS_ACCESS_KEY_ID")
         self.secret_key: str | None = os.getenv("AWS_SECRET_ACCESS_KEY")
         self.region: str = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
+        self._session: boto3.Session | None = None
+        self._clients: dict[tuple[str, str], Any] = {}
+        self._lock = threading.Lock()
 
     def get_session(self) -> boto3.Session:
-        """Get AWS session with configured credentials."""
-        return boto3.Session(
-            aws_access_key_id=self.access_key,
-            aws_secret_access_key=self.secret_key,
-            region_name=self.region,
-        )
+        """Get the AWS session with configured credentials, creating it on first use."""
+        with self._lock:
+            if self._session is None:
+                botocore_session = botocore.session.get_session()
+                botocore_session.register_component("data_loader", _LOADER)
+                self._session = boto3.Session(
+                    aws_access_key_id=self.access_key,
+                    aws_secret_access_key=self.secret_key,
+                    region_name=self.region,
+                    botocore_session=botocore_session,
+                )
+            return self._session
+
+    def get_client(self, service_name: str, region: str | None = None) -> Any:
+        """Get a client for a service and region, reusing it across calls.
+
+        Clients are thread-safe once created, but creating them from a shared
+        session is not, so creation is serialized.
+        """
+        key = (service_name, region or self.region)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        session = self.get_session()
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = session.client(service_name, region_name=key[1])  # type: ignore[call-overload]
+            return self._clients[key]
 
     def validate_connection(self) -> bool:
         """Test AWS connection and return True if successful.
@@ -37,8 +70,7 @@ class AWSConfig:
             AWSConnectionError: If connection fails.
         """
         try:
-            session = self.get_session()
-            sts = session.client("sts")
+            sts = self.get_client("sts")
             identity = sts.get_caller_identity()
             logger.info(f"AWS Connection successful! Account: {identity['Account']}")
             return True
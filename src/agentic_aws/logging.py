@@ -2,22 +2,41 @@
 
 from __future__ import annotations
 
-import json
+import atexit
+import copy
 import logging
+import queue
 import sys
-from datetime import UTC, datetime
+import time
+from logging.handlers import QueueHandler, QueueListener
 from typing import TYPE_CHECKING, Any
 
+import orjson
+
 if TYPE_CHECKING:
-    from collections.abc import MutableMapping
+    from collections.abc import Mapping, MutableMapping
 
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
 
+    _second: tuple[int, str] = (-1, "")
+
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        """Format the record's creation time as ISO 8601 UTC with milliseconds.
+
+        Records arrive in bursts, so the formatted second is reused until it changes.
+        """
+        second = int(record.created)
+        cached_second, prefix = self._second
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second = (second, prefix)
+        return f"{prefix}.{int(record.msecs):03d}Z"
+
     def format(self, record: logging.LogRecord) -> str:
         log_record: dict[str, Any] = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": self._timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -26,24 +45,47 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_record["exception"] = self.formatException(record.exc_info)
 
-        if hasattr(record, "extra_data"):
-            log_record["data"] = record.extra_data
+        # Extra fields live in the instance dict; one lookup replaces hasattr plus getattr.
+        extra_data = record.__dict__.get("extra_data")
+        if extra_data is not None:
+            log_record["data"] = extra_data
+
+        # Values orjson cannot encode fall back to str().
+        return orjson.dumps(log_record, default=str).decode()
 
-        return json.dumps(log_record)
+
+class DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting to the listener thread.
+
+    The stock QueueHandler formats records before enqueueing them, which keeps the
+    formatting cost on the caller and drops exception info the JSON formatter needs.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 class ContextLogger(logging.LoggerAdapter[logging.Logger]):
     """Logger adapter that adds context to log messages."""
 
+    def __init__(self, logger: logging.Logger, extra: Mapping[str, object] | None = None) -> None:
+        super().__init__(logger, extra)
+        # Copied once and only read afterwards, so records can share it.
+        self._context_data: dict[str, Any] = dict(extra) if extra else {}
+
     def process(self, msg: str, kwargs: MutableMapping[str, Any]) -> tuple[str, MutableMapping[str, Any]]:
-        extra = dict(kwargs.get("extra", {}))
-        context_data = dict(self.extra) if self.extra else {}
-        existing_extra = extra.get("extra_data", {})
+        extra = kwargs.get("extra") or {}
+        existing_extra = extra.get("extra_data")
         if isinstance(existing_extra, dict):
-            extra["extra_data"] = {**context_data, **existing_extra}
+            if not self._context_data:
+                return msg, kwargs
+            extra_data = {**self._context_data, **existing_extra}
         else:
-            extra["extra_data"] = context_data
-        kwargs["extra"] = extra
+            extra_data = self._context_data
+        kwargs["extra"] = {**extra, "extra_data": extra_data}
 
         return msg, kwargs
 
@@ -62,34 +104,66 @@ def get_logger(name: str, context: dict[str, Any] | None = None) -> ContextLogge
     return ContextLogger(logger, context or {})
 
 
+# Includes the stdlib aliases (WARN, FATAL) and NOTSET that getattr(logging, level) accepted.
+_LEVELS: dict[str, int] = logging.getLevelNamesMapping()
+
+# Chatty client libraries that only log warnings and above. The Anthropic SDK's HTTP client
+# logs every request under "httpx2".
+_QUIET_LOGGERS = ("httpx", "httpx2", "anthropic", "boto3", "botocore", "urllib3")
+
+_listener: QueueListener | None = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the background listener, if running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def setup_logging(
     level: str = "INFO",
     json_format: bool = True,
 ) -> None:
     """Configure logging for the application.
 
+    Records are handed to a queue and formatted and written by a background
+    listener thread, so logging calls never block on output.
+
     Args:
-        level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        level: Log level name, e.g. DEBUG, INFO, WARNING, ERROR or CRITICAL
         json_format: Whether to use JSON formatting
+
+    Raises:
+        ValueError: If level is not a standard logging level name.
     """
+    global _listener
+
+    log_level = _LEVELS.get(level.upper())
+    if log_level is None:
+        raise ValueError(f"Unknown log level: {level}")
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, level.upper()))
+    root_logger.setLevel(log_level)
 
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
+    _stop_listener()
+    root_logger.handlers.clear()
 
     handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(getattr(logging, level.upper()))
+    handler.setLevel(log_level)
 
     if json_format:
         handler.setFormatter(JSONFormatter())
     else:
         handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
 
-    root_logger.addHandler(handler)
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root_logger.addHandler(DeferredQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+
+    for name in _QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
 
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("anthropic").setLevel(logging.WARNING)
-    logging.getLogger("boto3").setLevel(logging.WARNING)
-    logging.getLogger("botocore").setLevel(logging.WARNING)
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
+atexit.register(_stop_listener)
@@ -1,27 +1,56 @@
 """Pydantic models for request/response validation."""
 
-import re
 from typing import Annotated, Any, Literal, TypeAlias
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter
 
 MessageRole: TypeAlias = Literal["user", "assistant"]
 OperationStatus: TypeAlias = Literal["success", "error"]
 AWSOperation: TypeAlias = Literal["create", "read", "update", "delete", "list"]
 
-AWS_RESOURCE_TYPE_PATTERN = re.compile(r"^AWS::[A-Za-z0-9]+::[A-Za-z0-9]+$")
-SAFE_IDENTIFIER_PATTERN = re.compile(r"^[a-zA-Z0-9_\-:./]+$")
+# Matched by pydantic-core's Rust regex engine through Field(pattern=...), which runs in linear
+# time and, unlike re, does not let "$" match before a trailing newline.
+AWS_RESOURCE_TYPE_PATTERN = r"^AWS::[A-Za-z0-9]+::[A-Za-z0-9]+$"
+SAFE_IDENTIFIER_PATTERN = r"^[a-zA-Z0-9_\-:./]+$"
+SESSION_ID_PATTERN = r"^[A-Za-z0-9_-]+$"
+
+AWSRegion: TypeAlias = Literal[
+    "us-east-1",
+    "us-east-2",
+    "us-west-1",
+    "us-west-2",
+    "eu-west-1",
+    "eu-west-2",
+    "eu-west-3",
+    "eu-central-1",
+    "eu-north-1",
+    "ap-northeast-1",
+    "ap-northeast-2",
+    "ap-northeast-3",
+    "ap-southeast-1",
+    "ap-southeast-2",
+    "ap-south-1",
+    "sa-east-1",
+    "ca-central-1",
+    "me-south-1",
+    "af-south-1",
+]
 
 
 class ChatMessage(BaseModel):
     """A single message in the conversation history."""
 
-    model_config = {"str_strip_whitespace": True}
+    model_config = {"str_strip_whitespace": True, "frozen": True}
 
     role: MessageRole = Field(description="Message role: 'user' or 'assistant'")
     content: str = Field(description="Message content", max_length=50000)
 
 
+# Built once and shared so history lists are validated and dumped without going through an
+# enclosing model's schema on every request.
+CHAT_HISTORY_ADAPTER: TypeAdapter[list[ChatMessage]] = TypeAdapter(list[ChatMessage])
+
+
 class ChatRequest(BaseModel):
     """Request model for the chat endpoint."""
 
@@ -33,6 +62,12 @@ class ChatRequest(BaseModel):
         description="Conversation history",
         max_length=100,
     )
+    session_id: str | None = Field(
+        default=None,
+        max_length=128,
+        pattern=SESSION_ID_PATTERN,
+        description="Session id; when set, history is stored server-side and the history field is ignored",
+    )
 
 
 class AWSResourceInput(BaseModel):
@@ -41,73 +76,36 @@ class AWSResourceInput(BaseModel):
     model_config = {"str_strip_whitespace": True}
 
     operation: AWSOperation = Field(description="The operation to perform")
-    resource_type: Annotated[str, Field(min_length=5, max_length=100)] = Field(
-        description="AWS resource type (e.g., AWS::S3::Bucket)"
+    resource_type: Annotated[str, Field(min_length=5, max_length=100, pattern=AWS_RESOURCE_TYPE_PATTERN)] = Field(
+        description="AWS resource type in AWS::Service::Resource format (e.g., AWS::S3::Bucket)"
+    )
+    identifier: Annotated[str, Field(max_length=2048, pattern=SAFE_IDENTIFIER_PATTERN)] | None = Field(
+        default=None,
+        description="Resource identifier (letters, digits, underscores, hyphens, colons, slashes and dots)",
     )
-    identifier: Annotated[str | None, Field(max_length=2048)] = Field(default=None, description="Resource identifier")
     properties: dict[str, Any] | None = Field(default=None, description="Resource properties")
-    region: str = Field(default="us-east-1", description="AWS region")
+    region: AWSRegion = Field(default="us-east-1", description="AWS region")
     max_results: Annotated[int, Field(ge=1, le=100)] = Field(
         default=20, description="Maximum number of results for list operations"
     )
     next_token: str | None = Field(default=None, description="Pagination token for list operations")
 
-    @field_validator("resource_type")
-    @classmethod
-    def validate_resource_type(cls, v: str) -> str:
-        if not AWS_RESOURCE_TYPE_PATTERN.match(v):
-            raise ValueError(f"Invalid AWS resource type format: {v}. Expected format: AWS::Service::Resource")
-        return v
-
-    @field_validator("identifier")
-    @classmethod
-    def validate_identifier(cls, v: str | None) -> str | None:
-        if v is not None and not SAFE_IDENTIFIER_PATTERN.match(v):
-            raise ValueError(
-                f"Invalid identifier format: {v}. "
-                "Only alphanumeric characters, underscores, hyphens, colons, slashes, and dots allowed."
-            )
-        return v
-
-    @field_validator("region")
-    @classmethod
-    def validate_region(cls, v: str) -> str:
-        valid_regions = [
-            "us-east-1",
-            "us-east-2",
-            "us-west-1",
-            "us-west-2",
-            "eu-west-1",
-            "eu-west-2",
-            "eu-west-3",
-            "eu-central-1",
-            "eu-north-1",
-            "ap-northeast-1",
-            "ap-northeast-2",
-            "ap-northeast-3",
-            "ap-southeast-1",
-            "ap-southeast-2",
-            "ap-south-1",
-            "sa-east-1",
-            "ca-central-1",
-            "me-south-1",
-            "af-south-1",
-        ]
-        if v not in valid_regions:
-            raise ValueError(f"Invalid AWS region: {v}")
-        return v
-
 
 class ChatResponse(BaseModel):
     """Response model for the chat endpoint."""
 
     response: str = Field(description="Agent response text")
-    updated_history: list[ChatMessage] = Field(description="Updated conversation history")
+    updated_history: list[ChatMessage] = Field(
+        default_factory=list,
+        description="Updated conversation history (empty when history is stored server-side)",
+    )
 
 
 class OperationResult(BaseModel):
     """Result of an AWS Cloud Control operation."""
 
+    model_config = {"frozen": True}
+
     status: OperationStatus = Field(description="Operation status: 'success' or 'error'")
     operation: AWSOperation = Field(description="Operation type performed")
     resource_type: str = Field(description="AWS resource type")
@@ -120,13 +118,15 @@ class OperationResult(BaseModel):
     properties: dict[str, Any] | None = Field(default=None, description="Resource properties")
     next_token: str | None = Field(default=None, description="Pagination token for next page")
     error: str | None = Field(default=None, description="Error message if failed")
-    aws_response: str | None = Field(default=None, description="Raw AWS response")
+    aws_response: str | None = Field(default=None, description="AWS request id of an unexpected response")
     aws_error: str | None = Field(default=None, description="AWS error details")
 
 
 class CloudWatchResult(BaseModel):
     """Result of a CloudWatch Logs query."""
 
+    model_config = {"frozen": True}
+
     status: OperationStatus = Field(description="Query status: 'success' or 'error'")
     function_name: str = Field(description="Lambda function name queried")
     hours_back: int | None = Field(default=None, description="Hours of logs queried")
@@ -143,6 +143,8 @@ OperationProgressStatus: TypeAlias = Literal[
 class OperationProgress(BaseModel):
     """Progress status for async Cloud Control API operations."""
 
+    model_config = {"frozen": True}
+
     request_token: str = Field(description="AWS request token for the operation")
     operation_status: OperationProgressStatus = Field(description="Current status of the operation")
     resource_type: str = Field(description="AWS resource type")
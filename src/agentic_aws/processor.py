@@ -1,17 +1,84 @@
 """Request processor with singleton agent pattern."""
 
-from functools import lru_cache
+from __future__ import annotations
 
-from agentic_aws.agent import AWSAgenticAgent
+import asyncio
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from agentic_aws.agent import AWSAgenticAgent
+
+
+_agent: AWSAgenticAgent | None = None
+_agent_lock = threading.Lock()
 
 
-@lru_cache(maxsize=1)
 def get_agent() -> AWSAgenticAgent:
-    """Get or create the singleton agent instance."""
-    return AWSAgenticAgent()
+    """Get or create the singleton agent instance.
+
+    The agent module, and with it the Anthropic SDK, is imported on first use. Requests
+    run in worker threads, so creation is locked to build exactly one agent.
+    """
+    global _agent
+    if _agent is None:
+        with _agent_lock:
+            if _agent is None:
+                from agentic_aws.agent import AWSAgenticAgent
 
+                _agent = AWSAgenticAgent()
+    return _agent
 
-def process_request(user_message: str, history: list[dict[str, str]]) -> str:
+
+def process_request(
+    user_message: str,
+    history: list[dict[str, str]],
+    on_text: Callable[[str], None] | None = None,
+) -> str:
     """Process a user request using the singleton agent."""
     agent = get_agent()
-    return agent.process_request(user_message, history=history)
+    return agent.process_request(user_message, history=history, on_text=on_text)
+
+
+async def process_request_async(user_message: str, history: list[dict[str, str]]) -> str:
+    """Process a user request without blocking the event loop.
+
+    The agent drives blocking boto3 and Anthropic clients, so the work runs in a
+    worker thread while the event loop keeps serving other requests.
+    """
+    return await asyncio.to_thread(process_request, user_message, history)
+
+
+def _discard_result(task: asyncio.Future[str]) -> None:
+    """Retrieve the outcome of a worker nobody is waiting for."""
+    if not task.cancelled():
+        task.exception()
+
+
+async def stream_request_async(user_message: str, history: list[dict[str, str]]) -> AsyncIterator[str]:
+    """Process a user request, yielding response text as the agent produces it.
+
+    Raises:
+        AWSAgentError: If the agent fails; raised after any text already yielded.
+    """
+    loop = asyncio.get_running_loop()
+    chunks: asyncio.Queue[str | None] = asyncio.Queue()
+
+    def on_text(text: str) -> None:
+        loop.call_soon_threadsafe(chunks.put_nowait, text)
+
+    task = asyncio.ensure_future(asyncio.to_thread(process_request, user_message, history, on_text))
+    task.add_done_callback(lambda _: chunks.put_nowait(None))
+
+    try:
+        while (chunk := await chunks.get()) is not None:
+            yield chunk
+    finally:
+        # The worker thread cannot be interrupted. If the caller stops early it keeps running
+        # to completion, and its outcome is retrieved so a failure is not reported as unhandled.
+        if not task.done():
+            task.add_done_callback(_discard_result)
+
+    await task
@@ -0,0 +1,93 @@
+"""Server-side conversation history storage keyed by session id."""
+
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+Message = dict[str, Any]
+
+
+def trim_history(messages: list[Message], max_messages: int) -> list[Message]:
+    """Keep the most recent messages, starting at a plain user turn.
+
+    Cutting a window can leave a tool result or assistant turn at the front, which
+    the Anthropic API rejects, so the window is advanced to the first user message
+    with text content.
+    """
+    window = messages[-max_messages:]
+    for index, message in enumerate(window):
+        if message.get("role") == "user" and isinstance(message.get("content"), str):
+            return window[index:]
+    return []
+
+
+class InMemorySessionStore:
+    """Session store kept in process memory, for single-worker deployments."""
+
+    def __init__(self, max_messages: int = 20, max_sessions: int = 1000) -> None:
+        self.max_messages = max_messages
+        self.max_sessions = max_sessions
+        self._sessions: OrderedDict[str, list[Message]] = OrderedDict()
+
+    async def get_history(self, session_id: str) -> list[Message]:
+        """Return the recent history window for a session."""
+        messages = self._sessions.get(session_id, [])
+        return trim_history(messages, self.max_messages)
+
+    async def append(self, session_id: str, messages: list[Message]) -> None:
+        """Append messages to a session, evicting the least recently used session when full."""
+        stored = self._sessions.setdefault(session_id, [])
+        stored.extend(messages)
+        del stored[: -self.max_messages]
+
+        self._sessions.move_to_end(session_id)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
+
+class RedisSessionStore:
+    """Session store backed by Redis lists, shared across workers and replicas."""
+
+    def __init__(self, client: Redis, max_messages: int = 20, ttl_seconds: int = 86400) -> None:
+        self.client = client
+        self.max_messages = max_messages
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f"session:{session_id}"
+
+    async def get_history(self, session_id: str) -> list[Message]:
+        """Return the recent history window for a session."""
+        raw_messages = await self.client.lrange(self._key(session_id), -self.max_messages, -1)
+        return trim_history([json.loads(raw) for raw in raw_messages], self.max_messages)
+
+    async def append(self, session_id: str, messages: list[Message]) -> None:
+        """Append messages to a session and refresh its expiry."""
+        if not messages:
+            return
+
+        key = self._key(session_id)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.rpush(key, *(json.dumps(message) for message in messages))
+            pipe.ltrim(key, -self.max_messages, -1)
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+
+
+SessionStore = InMemorySessionStore | RedisSessionStore
+
+
+def create_session_store(redis_url: str | None, max_messages: int = 20) -> SessionStore:
+    """Create a Redis-backed store when a URL is configured, otherwise an in-memory one."""
+    if not redis_url:
+        return InMemorySessionStore(max_messages=max_messages)
+
+    from redis.asyncio import Redis
+
+    return RedisSessionStore(Redis.from_url(redis_url), max_messages=max_messages)
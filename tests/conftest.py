@@ -1,10 +1,17 @@
 """Shared test fixtures."""
 
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+CALLER_IDENTITY = {
+    "Account": "123456789012",
+    "Arn": "arn:aws:iam::123456789012:user/test-user",
+    "UserId": "AIDAEXAMPLE",
+}
+
 
 @pytest.fixture
 def mock_aws_session() -> MagicMock:
@@ -12,28 +19,28 @@ def mock_aws_session() -> MagicMock:
     session = MagicMock()
 
     sts_client = MagicMock()
-    sts_client.get_caller_identity.return_value = {
-        "Account": "123456789012",
-        "Arn": "arn:aws:iam::123456789012:user/test-user",
-        "UserId": "AIDAEXAMPLE",
-    }
-
-    cloudcontrol_client = MagicMock()
-    logs_client = MagicMock()
-
-    def client_factory(service_name: str, **_kwargs: Any) -> MagicMock:
-        if service_name == "sts":
-            return sts_client
-        if service_name == "cloudcontrol":
-            return cloudcontrol_client
-        if service_name == "logs":
-            return logs_client
-        return MagicMock()
-
-    session.client = client_factory
+    sts_client.get_caller_identity.return_value = CALLER_IDENTITY
+    clients = {"sts": sts_client, "cloudcontrol": MagicMock(), "logs": MagicMock()}
+
+    session.client = lambda service_name, **_kwargs: clients.get(service_name) or MagicMock()
     return session
 
 
+def make_message_stream(response: MagicMock) -> MagicMock:
+    """Create a mock messages.stream() context manager that replays a response's blocks."""
+    events = []
+    for index, block in enumerate(response.content):
+        if block.type == "text":
+            events.append(SimpleNamespace(type="text", text=block.text))
+        events.append(SimpleNamespace(type="content_block_stop", index=index, content_block=block))
+
+    stream = MagicMock()
+    stream.__enter__.return_value = stream
+    stream.__iter__.side_effect = lambda: iter(events)
+    stream.get_final_message.return_value = response
+    return stream
+
+
 @pytest.fixture
 def mock_anthropic_client() -> MagicMock:
     """Create a mock Anthropic client."""
@@ -47,6 +54,7 @@ def mock_anthropic_client() -> MagicMock:
     response.content = [text_block]
 
     client.messages.create.return_value = response
+    client.messages.stream.side_effect = lambda **_kwargs: make_message_stream(response)
     return client
 
 
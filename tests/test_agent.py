@@ -1,12 +1,26 @@
 """Tests for AWS Agentic Agent."""
 
 import json
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
+from botocore.exceptions import ClientError, WaiterError
 
-from agentic_aws.agent import AWSAgenticAgent
+from agentic_aws.agent import ANTHROPIC_HTTP_CLIENT, TOOLS, AWSAgenticAgent
+from agentic_aws.models import OperationResult
+
+from .conftest import make_message_stream
+
+# Cloud Control returns resource properties as JSON strings.
+BUCKET_1_PROPERTIES = json.dumps({"BucketName": "test-bucket-1"})
+BUCKET_2_PROPERTIES = json.dumps({"BucketName": "test-bucket-2"})
+BUCKET_PROPERTIES = json.dumps({"BucketName": "test-bucket"})
 
 
 class TestAWSAgenticAgent:
@@ -42,30 +56,65 @@ class TestAWSAgenticAgent:
         assert agent.client is not None
         assert agent.aws_config is not None
 
-    def test_format_tools_returns_list(self, agent: AWSAgenticAgent) -> None:
-        """Test that _format_tools returns a list of tool definitions."""
+    def test_agents_share_anthropic_connection_pool(
+        self,
+        mock_environment: None,  # noqa: ARG002
+        mock_aws_session: MagicMock,
+    ) -> None:
+        """Test that every agent's Anthropic client uses the shared HTTP client."""
+        with (
+            patch("boto3.Session", return_value=mock_aws_session),
+            patch("anthropic.Anthropic") as mock_anthropic,
+        ):
+            AWSAgenticAgent()
+            AWSAgenticAgent()
+
+        http_clients = {id(call.kwargs["http_client"]) for call in mock_anthropic.call_args_list}
+        assert http_clients == {id(ANTHROPIC_HTTP_CLIENT)}
+
+    def test_format_tools_returns_definitions(self, agent: AWSAgenticAgent) -> None:
+        """Test that _format_tools returns the tool definitions."""
         tools = agent._format_tools()
 
-        assert isinstance(tools, list)
+        assert isinstance(tools, tuple)
         assert len(tools) > 0
         assert all("name" in tool for tool in tools)
 
     def test_format_tools_caches_result(self, agent: AWSAgenticAgent) -> None:
-        """Test that _format_tools caches the result."""
-        AWSAgenticAgent._tools = None
+        """Test that _format_tools returns the definitions parsed at import."""
+        assert agent._format_tools() is TOOLS
+
+    def test_process_request_sends_cacheable_system_prompt(
+        self,
+        agent: AWSAgenticAgent,
+        mock_anthropic_client: MagicMock,
+    ) -> None:
+        """Test that the system prompt is sent as a cacheable text block."""
+        with patch.object(agent, "client", mock_anthropic_client):
+            agent.process_request("Hello", [])
 
-        tools1 = agent._format_tools()
-        tools2 = agent._format_tools()
+        (block,) = mock_anthropic_client.messages.stream.call_args.kwargs["system"]
+        assert block["type"] == "text"
+        assert "AWS" in block["text"]
+        assert block["cache_control"] == {"type": "ephemeral"}
 
-        assert tools1 is tools2
+    def test_process_request_marks_prompt_cache_breakpoints(
+        self,
+        agent: AWSAgenticAgent,
+        mock_anthropic_client: MagicMock,
+    ) -> None:
+        """Test that the tools and the end of the conversation are marked for caching."""
+        history = [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello"}]
 
-    def test_build_system_prompt_returns_string(self, agent: AWSAgenticAgent) -> None:
-        """Test that _build_system_prompt returns a non-empty string."""
-        prompt = agent._build_system_prompt()
+        with patch.object(agent, "client", mock_anthropic_client):
+            agent.process_request("List my buckets", history)
 
-        assert isinstance(prompt, str)
-        assert len(prompt) > 0
-        assert "AWS" in prompt
+        kwargs = mock_anthropic_client.messages.stream.call_args.kwargs
+        assert kwargs["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert kwargs["messages"][-1]["content"] == [
+            {"type": "text", "text": "List my buckets", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert history[2] == {"role": "user", "content": "List my buckets"}
 
     def test_execute_aws_operation_list_success(
         self,
@@ -76,16 +125,12 @@ class TestAWSAgenticAgent:
         mock_cloudcontrol = MagicMock()
         mock_cloudcontrol.list_resources.return_value = {
             "ResourceDescriptions": [
-                {"Properties": json.dumps({"BucketName": "test-bucket-1"})},
-                {"Properties": json.dumps({"BucketName": "test-bucket-2"})},
+                {"Properties": BUCKET_1_PROPERTIES},
+                {"Properties": BUCKET_2_PROPERTIES},
             ]
         }
 
-        with patch.object(agent.aws_config, "get_session") as mock_get_session:
-            mock_session = MagicMock()
-            mock_session.client.return_value = mock_cloudcontrol
-            mock_get_session.return_value = mock_session
-
+        with patch.object(agent.aws_config, "get_client", return_value=mock_cloudcontrol):
             result = agent._execute_aws_operation(
                 operation="list",
                 resource_type="AWS::S3::Bucket",
@@ -95,6 +140,22 @@ class TestAWSAgenticAgent:
         assert result["operation"] == "list"
         assert result["count"] == 2
 
+    def test_execute_aws_operation_list_handles_missing_properties(self, agent: AWSAgenticAgent) -> None:
+        """Test that resources without Properties are listed as empty objects."""
+        mock_cloudcontrol = MagicMock()
+        mock_cloudcontrol.list_resources.return_value = {
+            "ResourceDescriptions": [
+                {"Identifier": "a"},
+                {"Properties": ""},
+                {"Properties": BUCKET_PROPERTIES},
+            ]
+        }
+
+        with patch.object(agent.aws_config, "get_client", return_value=mock_cloudcontrol):
+            result = agent._execute_aws_operation(operation="list", resource_type="AWS::S3::Bucket")
+
+        assert result["resources"] == [{}, {}, {"BucketName": "test-bucket"}]
+
     def test_execute_aws_operation_create_success(
         self,
         agent: AWSAgenticAgent,
@@ -108,11 +169,7 @@ class TestAWSAgenticAgent:
             }
         }
 
-        with patch.object(agent.aws_config, "get_session") as mock_get_session:
-            mock_session = MagicMock()
-            mock_session.client.return_value = mock_cloudcontrol
-            mock_get_session.return_value = mock_session
-
+        with patch.object(agent.aws_config, "get_client", return_value=mock_cloudcontrol):
             result = agent._execute_aws_operation(
                 operation="create",
                 resource_type="AWS::S3::Bucket",
@@ -122,6 +179,24 @@ class TestAWSAgenticAgent:
         assert result["status"] == "success"
         assert result["operation"] == "create"
         assert result["request_token"] == "test-token-123"
+        assert result["aws_response"] is None
+
+    def test_execute_aws_operation_create_reports_request_id_only(self, agent: AWSAgenticAgent) -> None:
+        """Test that an unexpected response is traced by request id, not dumped whole."""
+        mock_cloudcontrol = MagicMock()
+        mock_cloudcontrol.create_resource.return_value = {
+            "ResponseMetadata": {"RequestId": "req-1", "HTTPHeaders": {"x": "y" * 1000}},
+        }
+
+        with patch.object(agent.aws_config, "get_client", return_value=mock_cloudcontrol):
+            result = agent._execute_aws_operation(
+                operation="create",
+                resource_type="AWS::S3::Bucket",
+                properties={"BucketName": "test-bucket"},
+            )
+
+        assert result["status"] == "error"
+        assert json.loads(result["aws_response"]) == {"RequestId": "req-1"}
 
     def test_execute_aws_operation_read_success(
         self,
@@ -131,15 +206,11 @@ class TestAWSAgenticAgent:
         mock_cloudcontrol = MagicMock()
         mock_cloudcontrol.get_resource.return_value = {
             "ResourceDescription": {
-                "Properties": json.dumps({"BucketName": "test-bucket"}),
+                "Properties": BUCKET_PROPERTIES,
             }
         }
 
-        with patch.object(agent.aws_config, "get_session") as mock_get_session:
-            mock_session = MagicMock()
-            mock_session.client.return_value = mock_cloudcontrol
-            mock_get_session.return_value = mock_session
-
+        with patch.object(agent.aws_config, "get_client", return_value=mock_cloudcontrol):
             result = agent._execute_aws_operation(
                 operation="read",
                 resource_type="AWS::S3::Bucket",
@@ -150,6 +221,44 @@ class TestAWSAgenticAgent:
         assert result["operation"] == "read"
         assert result["properties"]["BucketName"] == "test-bucket"
 
+    def test_execute_aws_operation_update_sends_patch_document(self, agent: AWSAgenticAgent) -> None:
+        """Test that update replaces each property through a JSON Patch document."""
+        mock_cloudcontrol = MagicMock()
+        mock_cloudcontrol.update_resource.return_value = {
+            "ProgressEvent": {"OperationStatus": "IN_PROGRESS", "RequestToken": "token-1"}
+        }
+
+        with patch.object(agent.aws_config, "get_client", return_value=mock_cloudcontrol):
+            agent._execute_aws_operation(
+                operation="update",
+                resource_type="AWS::S3::Bucket",
+                identifier="test-bucket",
+                properties={"Tags": [{"Key": "env", "Value": "dev"}], "a/b~c": "x"},
+            )
+
+        patch_document = json.loads(mock_cloudcontrol.update_resource.call_args.kwargs["PatchDocument"])
+        assert patch_document == [
+            {"op": "replace", "path": "/Tags", "value": [{"Key": "env", "Value": "dev"}]},
+            {"op": "replace", "path": "/a~1b~0c", "value": "x"},
+        ]
+
+    def test_execute_aws_operation_reports_client_error(self, agent: AWSAgenticAgent) -> None:
+        """Test that AWS client errors become error results with the OperationResult schema."""
+        mock_cloudcontrol = MagicMock()
+        mock_cloudcontrol.get_resource.side_effect = ClientError(
+            {"Error": {"Code": "ResourceNotFoundException", "Message": "Bucket not found"}}, "GetResource"
+        )
+
+        with patch.object(agent.aws_config, "get_client", return_value=mock_cloudcontrol):
+            result = agent._execute_aws_operation(
+                operation="read", resource_type="AWS::S3::Bucket", identifier="missing-bucket"
+            )
+
+        assert result.keys() == OperationResult.model_fields.keys()
+        assert result["status"] == "error"
+        assert result["identifier"] == "missing-bucket"
+        assert result["error"] == "Failed to read resource: Bucket not found"
+
     def test_process_request_text_response(
         self,
         agent: AWSAgenticAgent,
@@ -166,29 +275,285 @@ class TestAWSAgenticAgent:
         assert history[0]["role"] == "user"
         assert history[1]["role"] == "assistant"
 
+    def test_process_request_streams_text_to_callback(
+        self,
+        agent: AWSAgenticAgent,
+        mock_anthropic_client: MagicMock,
+    ) -> None:
+        """Test that response text is passed to on_text as it is produced."""
+        chunks: list[str] = []
+
+        with patch.object(agent, "client", mock_anthropic_client):
+            result = agent.process_request("Hello", [], on_text=chunks.append)
+
+        assert "".join(chunks) == result
+
+    def test_process_request_runs_tool_calls_in_order(
+        self,
+        agent: AWSAgenticAgent,
+    ) -> None:
+        """Test that several tool calls in one turn all run and keep their order."""
+        tool_blocks = []
+        for index in range(3):
+            block = MagicMock()
+            block.type = "tool_use"
+            block.id = f"tool-{index}"
+            block.name = "cloudwatch_logs"
+            block.input = {"function_name": f"function-{index}"}
+            tool_blocks.append(block)
+
+        response = MagicMock()
+        response.content = tool_blocks
+        response.stop_reason = "end_turn"
+
+        def fake_execute_tool(_name: str, tool_input: dict[str, Any], _user_input: str) -> tuple[str, str]:
+            return json.dumps({"function": tool_input["function_name"]}), f"[{tool_input['function_name']}]"
+
+        history: list[dict[str, Any]] = []
+        with (
+            patch.object(agent.client.messages, "stream", return_value=make_message_stream(response)),
+            patch.object(agent, "_execute_tool", side_effect=fake_execute_tool),
+        ):
+            result = agent.process_request("Check my functions", history)
+
+        assert result == "[function-0][function-1][function-2]"
+        assert [r["tool_use_id"] for r in history[-1]["content"]] == ["tool-0", "tool-1", "tool-2"]
+
+    def test_process_request_starts_tools_while_streaming(self, agent: AWSAgenticAgent) -> None:
+        """Test that a tool runs as soon as its block arrives, before the response finishes."""
+        tool_block = MagicMock(type="tool_use", id="tool-0", input={"function_name": "fn"})
+        tool_block.name = "cloudwatch_logs"
+        text_block = MagicMock(type="text", text="Checking logs")
+        response = MagicMock(content=[tool_block, text_block], stop_reason="end_turn")
+        tool_started = threading.Event()
+
+        def events() -> Iterator[SimpleNamespace]:
+            yield SimpleNamespace(type="content_block_stop", index=0, content_block=tool_block)
+            assert tool_started.wait(timeout=1)
+            yield SimpleNamespace(type="text", text="Checking logs")
+
+        def fake_execute_tool(*_args: Any) -> tuple[str, str]:
+            tool_started.set()
+            return '{"status":"success"}', ""
+
+        stream = make_message_stream(response)
+        stream.__iter__.side_effect = events
+        with (
+            patch.object(agent.client.messages, "stream", return_value=stream),
+            patch.object(agent, "_execute_tool", side_effect=fake_execute_tool),
+        ):
+            result = agent.process_request("Check fn", [])
+
+        assert result == "Checking logs"
+
+    def test_execute_tool_skips_summary_by_default(self, agent: AWSAgenticAgent) -> None:
+        """Test that tool results are returned without an extra Claude call."""
+        result = {"status": "success", "operation": "list"}
+
+        with (
+            patch.object(agent, "_execute_aws_operation", return_value=result),
+            patch.object(agent.client.messages, "create") as mock_create,
+        ):
+            tool_result, formatted_output = agent._execute_tool(
+                "aws_cloud_control",
+                {"operation": "list", "resource_type": "AWS::S3::Bucket"},
+                "List my buckets",
+            )
+
+        assert json.loads(tool_result) == result
+        assert formatted_output == ""
+        mock_create.assert_not_called()
+
+    def test_execute_tool_reports_invalid_input(self, agent: AWSAgenticAgent) -> None:
+        """Test that tool input failing validation becomes an error result."""
+        result_json, _ = agent._execute_tool(
+            "aws_cloud_control",
+            {"operation": "explode", "resource_type": "AWS::S3::Bucket"},
+            "Explode my bucket",
+        )
+        result = json.loads(result_json)
+
+        assert result["status"] == "error"
+        assert result["operation"] == "explode"
+        assert result["error"].startswith("Validation error:")
+
+    def test_execute_tool_summarizes_when_enabled(self, agent: AWSAgenticAgent) -> None:
+        """Test that summarize=True adds a Claude summary of the tool result."""
+        agent.summarize = True
+
+        with (
+            patch.object(agent, "_execute_aws_operation", return_value={"status": "success"}),
+            patch.object(agent, "_complete_short", return_value="Two buckets found") as mock_complete,
+        ):
+            _, formatted_output = agent._execute_tool(
+                "aws_cloud_control",
+                {"operation": "list", "resource_type": "AWS::S3::Bucket"},
+                "List my buckets",
+            )
+
+        assert formatted_output == "\n\nAI Summary:\nTwo buckets found"
+        mock_complete.assert_called_once()
+
+    def test_summary_calls_are_bounded(self, agent: AWSAgenticAgent) -> None:
+        """Test that concurrent summary requests never exceed the available slots."""
+        agent._summary_slots = threading.BoundedSemaphore(2)
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fake_create(**_kwargs: Any) -> MagicMock:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return MagicMock(content=[MagicMock(text="summary")])
+
+        with (
+            patch.object(agent.client.messages, "create", side_effect=fake_create),
+            ThreadPoolExecutor(max_workers=6) as executor,
+        ):
+            summaries = list(executor.map(agent._complete_short, ["prompt"] * 6))
+
+        assert summaries == ["summary"] * 6
+        assert peak == 2
+
     def test_query_cloudwatch_logs_success(
         self,
         agent: AWSAgenticAgent,
     ) -> None:
-        """Test successful CloudWatch logs query."""
+        """Test successful CloudWatch Logs Insights query."""
         mock_logs = MagicMock()
-        mock_logs.filter_log_events.return_value = {
-            "events": [
-                {
-                    "timestamp": 1704067200000,
-                    "message": "ERROR: Something went wrong",
-                    "logStreamName": "test-stream",
-                }
-            ]
-        }
-
-        with patch.object(agent.aws_config, "get_session") as mock_get_session:
-            mock_session = MagicMock()
-            mock_session.client.return_value = mock_logs
-            mock_get_session.return_value = mock_session
+        mock_logs.start_query.return_value = {"queryId": "query-1"}
+        mock_logs.get_query_results.side_effect = [
+            {"status": "Running", "results": []},
+            {
+                "status": "Complete",
+                "results": [
+                    [
+                        {"field": "@timestamp", "value": "2024-01-01 00:00:00.000"},
+                        {"field": "@message", "value": "ERROR: Something went wrong"},
+                        {"field": "@logStream", "value": "test-stream"},
+                        {"field": "@ptr", "value": "abc"},
+                    ]
+                ],
+                "statistics": {"recordsMatched": 12.0},
+            },
+        ]
 
+        with (
+            patch.object(agent.aws_config, "get_client", return_value=mock_logs),
+            patch("agentic_aws.agent.time.sleep"),
+        ):
             result = agent._query_cloudwatch_logs("test-function", hours_back=1)
 
         assert result["status"] == "success"
         assert result["function_name"] == "test-function"
-        assert result["error_count"] == 1
+        assert result["error_count"] == 12
+        assert result["error_logs"] == [
+            {
+                "timestamp": "2024-01-01 00:00:00.000",
+                "message": "ERROR: Something went wrong",
+                "logStreamName": "test-stream",
+            }
+        ]
+        query_kwargs = mock_logs.start_query.call_args.kwargs
+        assert query_kwargs["logGroupName"] == "/aws/lambda/test-function"
+        assert query_kwargs["endTime"] - query_kwargs["startTime"] == 3600
+
+    def test_query_cloudwatch_logs_reports_failed_query(self, agent: AWSAgenticAgent) -> None:
+        """Test that a Logs Insights query that does not complete is reported as an error."""
+        mock_logs = MagicMock()
+        mock_logs.start_query.return_value = {"queryId": "query-1"}
+        mock_logs.get_query_results.return_value = {"status": "Failed", "results": []}
+
+        with patch.object(agent.aws_config, "get_client", return_value=mock_logs):
+            result = agent._query_cloudwatch_logs("test-function")
+
+        assert result["status"] == "error"
+        assert "Failed" in result["error"]
+
+    def test_poll_operation_status_uses_waiter(self, agent: AWSAgenticAgent) -> None:
+        """Test that a completed operation is reported from the waiter's final status."""
+        mock_cloudcontrol = MagicMock()
+        mock_cloudcontrol.get_resource_request_status.return_value = {
+            "ProgressEvent": {
+                "OperationStatus": "SUCCESS",
+                "TypeName": "AWS::S3::Bucket",
+                "Identifier": "my-bucket",
+            }
+        }
+
+        with patch.object(agent.aws_config, "get_client", return_value=mock_cloudcontrol):
+            result = agent._poll_operation_status("token-1", max_wait_seconds=60, initial_delay=5)
+
+        mock_cloudcontrol.get_waiter.assert_called_once_with("resource_request_success")
+        mock_cloudcontrol.get_waiter.return_value.wait.assert_called_once_with(
+            RequestToken="token-1",
+            WaiterConfig={"MaxAttempts": 1},
+        )
+        assert result.operation_status == "SUCCESS"
+        assert result.identifier == "my-bucket"
+
+    def test_poll_operation_status_reuses_operation_client(self, agent: AWSAgenticAgent) -> None:
+        """Test that polling shares the Cloud Control client used to start the operation."""
+        mock_cloudcontrol = MagicMock()
+        mock_cloudcontrol.create_resource.return_value = {
+            "ProgressEvent": {"RequestToken": "token-1", "OperationStatus": "IN_PROGRESS"}
+        }
+        mock_cloudcontrol.get_resource_request_status.return_value = {"ProgressEvent": {"OperationStatus": "SUCCESS"}}
+        mock_session = MagicMock()
+        mock_session.client.return_value = mock_cloudcontrol
+        agent.aws_config._clients.clear()
+
+        with patch.object(agent.aws_config, "get_session", return_value=mock_session):
+            agent._execute_aws_operation(
+                operation="create",
+                resource_type="AWS::S3::Bucket",
+                properties={"BucketName": "test-bucket"},
+                region="eu-west-1",
+            )
+            agent._poll_operation_status("token-1", region="eu-west-1")
+
+        mock_session.client.assert_called_once_with("cloudcontrol", region_name="eu-west-1")
+
+    def test_poll_operation_status_reports_timeout(self, agent: AWSAgenticAgent) -> None:
+        """Test that an operation still running when the waiter gives up is IN_PROGRESS."""
+        mock_cloudcontrol = MagicMock()
+        mock_cloudcontrol.get_waiter.return_value.wait.side_effect = WaiterError(
+            name="ResourceRequestSuccess",
+            reason="Max attempts exceeded",
+            last_response={"ProgressEvent": {"OperationStatus": "IN_PROGRESS", "TypeName": "AWS::S3::Bucket"}},
+        )
+
+        with (
+            patch.object(agent.aws_config, "get_client", return_value=mock_cloudcontrol),
+            patch("agentic_aws.agent.time.sleep"),
+        ):
+            result = agent._poll_operation_status("token-1", max_wait_seconds=10, initial_delay=5)
+
+        assert result.operation_status == "IN_PROGRESS"
+        assert result.resource_type == "AWS::S3::Bucket"
+        assert result.retry_after == 11
+        mock_cloudcontrol.get_resource_request_status.assert_not_called()
+
+    def test_poll_operation_status_backs_off(self, agent: AWSAgenticAgent) -> None:
+        """Test that the delay between polls grows by 1.5x and is capped at 30 seconds."""
+        mock_cloudcontrol = MagicMock()
+        mock_cloudcontrol.get_waiter.return_value.wait.side_effect = WaiterError(
+            name="ResourceRequestSuccess",
+            reason="Max attempts exceeded",
+            last_response={"ProgressEvent": {"OperationStatus": "IN_PROGRESS"}},
+        )
+
+        with (
+            patch.object(agent.aws_config, "get_client", return_value=mock_cloudcontrol),
+            patch("agentic_aws.agent.time.sleep") as mock_sleep,
+        ):
+            agent._poll_operation_status("token-1")
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert delays == pytest.approx([2.0, 3.0, 4.5, 6.75, 10.125, 15.1875, 22.78125, 30.0, 30.0])
+        assert mock_cloudcontrol.get_waiter.return_value.wait.call_count == len(delays)
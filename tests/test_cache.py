@@ -0,0 +1,92 @@
+"""Tests for the response cache."""
+
+import json
+from typing import Any
+from unittest.mock import patch
+
+from agentic_aws.cache import ResponseCache, is_replayable_turn
+from agentic_aws.models import ChatResponse
+
+
+class TestResponseCache:
+    """Tests for ResponseCache class."""
+
+    def test_make_key_depends_on_history(self) -> None:
+        """Test that the same message with different history yields different keys."""
+        key1 = ResponseCache.make_key("list buckets", [])
+        key2 = ResponseCache.make_key("list buckets", [{"role": "user", "content": "Hello"}])
+
+        assert key1 != key2
+        assert key1 == ResponseCache.make_key("list buckets", [])
+
+    def test_get_returns_stored_response(self) -> None:
+        """Test that a stored response is returned before it expires."""
+        cache = ResponseCache(ttl_seconds=60)
+        response = ChatResponse(response="Done", updated_history=[])
+
+        cache.set("key", response)
+
+        assert cache.get("key") is response
+
+    def test_get_drops_expired_response(self) -> None:
+        """Test that expired entries are not returned."""
+        cache = ResponseCache(ttl_seconds=60)
+        cache.set("key", ChatResponse(response="Done", updated_history=[]))
+
+        with patch("agentic_aws.cache.time.monotonic", return_value=float("inf")):
+            assert cache.get("key") is None
+
+    def test_set_evicts_least_recently_used(self) -> None:
+        """Test that the oldest entry is evicted once the cache is full."""
+        cache = ResponseCache(ttl_seconds=60, max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, ChatResponse(response=key, updated_history=[]))
+
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+
+    def test_disabled_cache_stores_nothing(self) -> None:
+        """Test that a zero TTL disables caching."""
+        cache = ResponseCache(ttl_seconds=0)
+        cache.set("key", ChatResponse(response="Done", updated_history=[]))
+
+        assert cache.get("key") is None
+
+
+def tool_turn(operation: str, status: str) -> list[dict[str, Any]]:
+    """Build an agent turn that made one aws_cloud_control call and then replied."""
+    return [
+        {"role": "user", "content": "Do it"},
+        {
+            "role": "assistant",
+            "content": [
+                {"type": "tool_use", "id": "t1", "name": "aws_cloud_control", "input": {"operation": operation}}
+            ],
+        },
+        {
+            "role": "user",
+            "content": [{"type": "tool_result", "tool_use_id": "t1", "content": json.dumps({"status": status})}],
+        },
+        {"role": "assistant", "content": [{"type": "text", "text": "Done"}]},
+    ]
+
+
+class TestIsReplayableTurn:
+    """Tests for is_replayable_turn."""
+
+    def test_read_only_turn_is_replayable(self) -> None:
+        """Test that a successful turn that only read resources may be cached."""
+        assert is_replayable_turn(tool_turn("list", "success"))
+
+    def test_mutating_turn_is_not_replayable(self) -> None:
+        """Test that a turn that created, updated or deleted resources is never cached."""
+        for operation in ("create", "update", "delete"):
+            assert not is_replayable_turn(tool_turn(operation, "success"))
+
+    def test_failed_tool_call_is_not_replayable(self) -> None:
+        """Test that a turn whose tool call failed is run again rather than replayed."""
+        assert not is_replayable_turn(tool_turn("read", "error"))
+
+    def test_turn_without_reply_is_not_replayable(self) -> None:
+        """Test that a turn cut short by an Anthropic error is not cached."""
+        assert not is_replayable_turn([{"role": "user", "content": "Hello"}])
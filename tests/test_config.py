@@ -35,16 +35,30 @@ class TestAWSConfig:
         mock_environment: None,  # noqa: ARG002
         patched_boto3_session: MagicMock,
     ) -> None:
-        """Test that get_session returns a boto3 Session."""
+        """Test that get_session builds one boto3 Session and reuses it."""
         config = AWSConfig()
         session = config.get_session()
 
-        patched_boto3_session.assert_called_once_with(
-            aws_access_key_id="test-access-key",
-            aws_secret_access_key="test-secret-key",
-            region_name="us-east-1",
-        )
-        assert session is not None
+        assert config.get_session() is session
+        patched_boto3_session.assert_called_once()
+        assert patched_boto3_session.call_args.kwargs["aws_access_key_id"] == "test-access-key"
+        assert patched_boto3_session.call_args.kwargs["aws_secret_access_key"] == "test-secret-key"
+        assert patched_boto3_session.call_args.kwargs["region_name"] == "us-east-1"
+
+    def test_get_client_reuses_clients_per_region(
+        self,
+        mock_environment: None,  # noqa: ARG002
+        patched_boto3_session: MagicMock,
+    ) -> None:
+        """Test that get_client creates each service and region client once."""
+        session = patched_boto3_session.return_value
+        session.client = MagicMock(side_effect=lambda *_args, **_kwargs: MagicMock())
+        config = AWSConfig()
+
+        default_client = config.get_client("cloudcontrol")
+        assert config.get_client("cloudcontrol", "us-east-1") is default_client
+        assert config.get_client("cloudcontrol", "eu-west-1") is not default_client
+        assert session.client.call_count == 2
 
     def test_validate_connection_success(
         self,
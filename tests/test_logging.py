@@ -0,0 +1,129 @@
+"""Tests for structured logging configuration."""
+
+import json
+import logging
+import queue
+import sys
+
+import pytest
+
+from agentic_aws.logging import ContextLogger, DeferredQueueHandler, JSONFormatter, _stop_listener, setup_logging
+
+
+class TestDeferredQueueHandler:
+    """Tests for DeferredQueueHandler class."""
+
+    def test_enqueues_unformatted_record_with_exception(self) -> None:
+        """Test that the message is merged but exception info is kept for the formatter."""
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        handler = DeferredQueueHandler(log_queue)
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord("test", logging.ERROR, __file__, 1, "failed %s", ("op",), sys.exc_info())
+        handler.emit(record)
+
+        queued = log_queue.get_nowait()
+        assert queued.msg == "failed op"
+        assert queued.args is None
+        assert queued.exc_info is not None
+
+        log_record = json.loads(JSONFormatter().format(queued))
+        assert log_record["message"] == "failed op"
+        assert "ValueError: boom" in log_record["exception"]
+
+
+class TestJSONFormatter:
+    """Tests for JSONFormatter class."""
+
+    def test_formats_record_as_json(self) -> None:
+        """Test that records become one JSON object with a UTC timestamp and extra data."""
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "hello", None, None)
+        record.extra_data = {"region": "us-east-1", "path": object()}
+
+        log_record = json.loads(JSONFormatter().format(record))
+
+        assert log_record["level"] == "INFO"
+        assert log_record["message"] == "hello"
+        assert log_record["timestamp"].endswith("Z")
+        assert log_record["data"]["region"] == "us-east-1"
+        assert log_record["data"]["path"].startswith("<object")
+
+    def test_omits_data_without_extra(self) -> None:
+        """Test that records from plain loggers have no data field."""
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "hello %s", ("world",), None)
+
+        log_record = json.loads(JSONFormatter().format(record))
+
+        assert log_record["message"] == "hello world"
+        assert "data" not in log_record
+
+    def test_timestamp_is_record_creation_time(self) -> None:
+        """Test that the timestamp is when the record was created, not when it was formatted."""
+        formatter = JSONFormatter()
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "hello", None, None)
+        record.created = 1704067200.25
+        record.msecs = 250.0
+
+        assert json.loads(formatter.format(record))["timestamp"] == "2024-01-01T00:00:00.250Z"
+
+        record.created = 1704067261.5
+        record.msecs = 500.0
+        assert json.loads(formatter.format(record))["timestamp"] == "2024-01-01T00:01:01.500Z"
+
+
+class TestContextLogger:
+    """Tests for ContextLogger class."""
+
+    def test_merges_context_with_call_extra(self) -> None:
+        """Test that call-site extra data is layered over the logger context."""
+        logger = ContextLogger(logging.getLogger("test"), {"region": "us-east-1", "op": "list"})
+
+        _, kwargs = logger.process("hello", {"extra": {"extra_data": {"op": "read"}}})
+
+        assert kwargs["extra"]["extra_data"] == {"region": "us-east-1", "op": "read"}
+
+    def test_adds_context_without_call_extra(self) -> None:
+        """Test that records without extra still carry the logger context."""
+        logger = ContextLogger(logging.getLogger("test"), {"region": "us-east-1"})
+
+        _, kwargs = logger.process("hello", {})
+
+        assert kwargs["extra"]["extra_data"] == {"region": "us-east-1"}
+
+    def test_passes_call_extra_through_without_context(self) -> None:
+        """Test that a logger without context leaves the caller's extra untouched."""
+        logger = ContextLogger(logging.getLogger("test"), {})
+        extra = {"extra_data": {"op": "read"}}
+
+        _, kwargs = logger.process("hello", {"extra": extra})
+
+        assert kwargs["extra"] is extra
+
+
+class TestSetupLogging:
+    """Tests for setup_logging."""
+
+    def test_accepts_level_alias(self) -> None:
+        """Test that stdlib level aliases such as WARN still configure the root logger."""
+        root_logger = logging.getLogger()
+        previous_level, previous_handlers = root_logger.level, list(root_logger.handlers)
+
+        try:
+            setup_logging(level="warn")
+
+            assert root_logger.level == logging.WARNING
+        finally:
+            _stop_listener()
+            root_logger.handlers[:] = previous_handlers
+            root_logger.setLevel(previous_level)
+
+    def test_rejects_unknown_level(self) -> None:
+        """Test that a misspelled level fails before the root logger is touched."""
+        handlers = list(logging.getLogger().handlers)
+
+        with pytest.raises(ValueError, match="Unknown log level: verbose"):
+            setup_logging(level="verbose")
+
+        assert logging.getLogger().handlers == handlers
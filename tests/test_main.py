@@ -0,0 +1,370 @@
+"""Tests for the FastAPI application."""
+
+import asyncio
+import json
+import threading
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import main
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from agentic_aws.cache import ResponseCache
+from agentic_aws.exceptions import AWSConnectionError
+from agentic_aws.models import ChatRequest
+from agentic_aws.sessions import InMemorySessionStore
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    """Create a test client with a fresh rate limiter and response cache."""
+    main.limiter.reset()
+    main.app.state.response_cache = ResponseCache(ttl_seconds=60)
+    main.app.state.session_store = InMemorySessionStore()
+    main.app.state.readiness = (float("-inf"), None)
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+class TestLifespan:
+    """Tests for per-process startup."""
+
+    async def test_worker_threads_cover_agent_concurrency(self) -> None:
+        """Test that AGENT_CONCURRENCY agent runs can be in worker threads at once."""
+        barrier = threading.Barrier(main.AGENT_CONCURRENCY)
+
+        async with main.lifespan(main.app):
+            await asyncio.gather(*(asyncio.to_thread(barrier.wait, 5) for _ in range(main.AGENT_CONCURRENCY)))
+
+
+class TestCORS:
+    """Tests for CORS configuration."""
+
+    def test_preflight_is_cacheable(self, client: TestClient) -> None:
+        """Test that preflight responses tell browsers to cache them for a day."""
+        response = client.options(
+            "/chat",
+            headers={
+                "Origin": "http://localhost:8501",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "Content-Type",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["access-control-max-age"] == "86400"
+
+
+class TestReadyEndpoint:
+    """Tests for the /ready endpoint."""
+
+    def test_ready_reuses_recent_check(self, client: TestClient) -> None:
+        """Test that probes within the TTL do not repeat the AWS check."""
+        with patch("main.AWSConfig") as mock_config:
+            first = client.get("/ready")
+            second = client.get("/ready")
+
+        assert first.status_code == second.status_code == 200
+        mock_config.return_value.validate_connection.assert_called_once()
+
+    def test_ready_reports_cached_failure(self, client: TestClient) -> None:
+        """Test that a failed check is reported as 503 until it is retried."""
+        with patch("main.AWSConfig") as mock_config:
+            mock_config.return_value.validate_connection.side_effect = AWSConnectionError("no credentials")
+            first = client.get("/ready")
+            second = client.get("/ready")
+
+        assert first.status_code == second.status_code == 503
+        assert second.json()["detail"]["error"] == "no credentials"
+        mock_config.return_value.validate_connection.assert_called_once()
+
+
+class TestChatEndpoint:
+    """Tests for the /chat endpoint."""
+
+    def test_chat_returns_agent_response(self, client: TestClient) -> None:
+        """Test that /chat awaits the processor and returns its reply."""
+
+        async def fake_process(message: str, history: list[dict[str, Any]]) -> str:
+            history.append({"role": "user", "content": message})
+            history.append({"role": "assistant", "content": "Hello back"})
+            return "Hello back"
+
+        with patch("main.process_request_async", AsyncMock(side_effect=fake_process)) as mock_process:
+            response = client.post("/chat", json={"message": "Hello", "history": []})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["response"] == "Hello back"
+        assert [msg["role"] for msg in data["updated_history"]] == ["user", "assistant"]
+        mock_process.assert_awaited_once()
+
+    def test_chat_returns_text_history_for_structured_agent_turns(self, client: TestClient) -> None:
+        """Test that content blocks stored by the agent do not leak into updated_history."""
+
+        async def fake_process(message: str, history: list[dict[str, Any]]) -> str:
+            history.append({"role": "user", "content": message})
+            history.append({"role": "assistant", "content": [{"type": "text", "text": "Found 2 buckets"}]})
+            return "Found 2 buckets"
+
+        history = [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello"}]
+        with patch("main.process_request_async", AsyncMock(side_effect=fake_process)):
+            response = client.post("/chat", json={"message": "List my buckets", "history": history})
+
+        assert response.status_code == 200
+        assert response.json()["updated_history"] == [
+            *history,
+            {"role": "user", "content": "List my buckets"},
+            {"role": "assistant", "content": "Found 2 buckets"},
+        ]
+
+    def test_chat_sends_only_recent_history_to_agent(self, client: TestClient) -> None:
+        """Test that client-supplied history is trimmed before reaching the agent."""
+        history = [{"role": "user" if i % 2 == 0 else "assistant", "content": str(i)} for i in range(6)]
+        mock_process = AsyncMock(return_value="Done")
+
+        with patch("main.process_request_async", mock_process), patch("main.SESSION_HISTORY_MAX", 2):
+            response = client.post("/chat", json={"message": "Hello", "history": history})
+
+        assert mock_process.await_args is not None
+        assert mock_process.await_args.args[1] == history[-2:]
+        assert len(response.json()["updated_history"]) == len(history) + 2
+
+    def test_chat_compresses_large_responses(self, client: TestClient) -> None:
+        """Test that long conversation payloads are gzip-compressed."""
+        history = [{"role": "user", "content": "x" * 2000}, {"role": "assistant", "content": "ok"}]
+
+        with patch("main.process_request_async", AsyncMock(return_value="Done")):
+            response = client.post(
+                "/chat",
+                json={"message": "Hello", "history": history},
+                headers={"Accept-Encoding": "gzip"},
+            )
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["response"] == "Done"
+
+    def test_chat_serves_repeated_request_from_cache(self, client: TestClient) -> None:
+        """Test that an identical message and history is answered without the agent."""
+        payload = {"message": "List my buckets", "history": []}
+
+        async def fake_process(message: str, history: list[dict[str, Any]]) -> str:
+            history.append({"role": "user", "content": message})
+            history.append({"role": "assistant", "content": [{"type": "text", "text": "No buckets"}]})
+            return "No buckets"
+
+        with patch("main.process_request_async", AsyncMock(side_effect=fake_process)) as mock_process:
+            first = client.post("/chat", json=payload)
+            second = client.post("/chat", json=payload)
+
+        assert first.json() == second.json()
+        mock_process.assert_awaited_once()
+
+    def test_chat_does_not_replay_mutating_turns(self, client: TestClient) -> None:
+        """Test that a repeated request that deleted a resource runs the agent again."""
+        payload = {"message": "Delete bucket logs", "history": []}
+
+        async def fake_process(message: str, history: list[dict[str, Any]]) -> str:
+            history.append({"role": "user", "content": message})
+            history.append(
+                {
+                    "role": "assistant",
+                    "content": [
+                        {"type": "tool_use", "id": "t1", "name": "aws_cloud_control", "input": {"operation": "delete"}}
+                    ],
+                }
+            )
+            history.append(
+                {
+                    "role": "user",
+                    "content": [{"type": "tool_result", "tool_use_id": "t1", "content": '{"status":"success"}'}],
+                }
+            )
+            history.append({"role": "assistant", "content": [{"type": "text", "text": "Deleting"}]})
+            return "Deleting"
+
+        with patch("main.process_request_async", AsyncMock(side_effect=fake_process)) as mock_process:
+            client.post("/chat", json=payload)
+            client.post("/chat", json=payload)
+
+        assert mock_process.await_count == 2
+
+    def test_chat_does_not_replay_failed_turns(self, client: TestClient) -> None:
+        """Test that an Anthropic error reply is not served again on retry."""
+        payload = {"message": "List my buckets", "history": []}
+
+        async def fake_process(message: str, history: list[dict[str, Any]]) -> str:
+            history.append({"role": "user", "content": message})
+            return "Error: Anthropic API error: overloaded"
+
+        with patch("main.process_request_async", AsyncMock(side_effect=fake_process)) as mock_process:
+            client.post("/chat", json=payload)
+            client.post("/chat", json=payload)
+
+        assert mock_process.await_count == 2
+
+    def test_chat_cache_is_not_shared_between_sessions(self, client: TestClient) -> None:
+        """Test that the first message of one session is not answered from another's reply."""
+
+        async def fake_process(message: str, history: list[dict[str, Any]]) -> str:
+            history.append({"role": "user", "content": message})
+            history.append({"role": "assistant", "content": [{"type": "text", "text": "No buckets"}]})
+            return "No buckets"
+
+        with patch("main.process_request_async", AsyncMock(side_effect=fake_process)) as mock_process:
+            client.post("/chat", json={"message": "List my buckets", "session_id": "alice"})
+            client.post("/chat", json={"message": "List my buckets", "session_id": "bob"})
+
+        assert mock_process.await_count == 2
+
+    def test_chat_cache_is_not_shared_between_histories_with_the_same_tail(self, client: TestClient) -> None:
+        """Test that a client is not answered with another's reply when only the trimmed window matches."""
+        tail = [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello"}]
+        alice = [{"role": "user", "content": "My account id is 111111111111"}, {"role": "assistant", "content": "Ok"}]
+        bob = [{"role": "user", "content": "Use the staging profile"}, {"role": "assistant", "content": "Ok"}]
+
+        async def fake_process(message: str, history: list[dict[str, Any]]) -> str:
+            history.append({"role": "user", "content": message})
+            history.append({"role": "assistant", "content": [{"type": "text", "text": "No buckets"}]})
+            return "No buckets"
+
+        with (
+            patch("main.process_request_async", AsyncMock(side_effect=fake_process)) as mock_process,
+            patch("main.SESSION_HISTORY_MAX", 2),
+        ):
+            client.post("/chat", json={"message": "List my buckets", "history": alice + tail})
+            response = client.post("/chat", json={"message": "List my buckets", "history": bob + tail})
+
+        assert mock_process.await_count == 2
+        assert response.json()["updated_history"][: len(bob)] == bob
+
+    def test_chat_keeps_history_server_side_for_sessions(self, client: TestClient) -> None:
+        """Test that session requests read and store history on the server."""
+        seen_history: list[list[dict[str, Any]]] = []
+
+        async def fake_process(message: str, history: list[dict[str, Any]]) -> str:
+            seen_history.append(list(history))
+            history.append({"role": "user", "content": message})
+            history.append({"role": "assistant", "content": [{"type": "text", "text": f"Re: {message}"}]})
+            return f"Re: {message}"
+
+        with patch("main.process_request_async", AsyncMock(side_effect=fake_process)):
+            first = client.post("/chat", json={"message": "Hello", "session_id": "abc"})
+            second = client.post("/chat", json={"message": "Again", "session_id": "abc"})
+
+        assert first.status_code == 200
+        assert second.json() == {"response": "Re: Again", "updated_history": []}
+        assert seen_history[0] == []
+        assert [msg["role"] for msg in seen_history[1]] == ["user", "assistant"]
+
+    def test_chat_rejects_empty_message(self, client: TestClient) -> None:
+        """Test that request validation rejects an empty message."""
+        response = client.post("/chat", json={"message": "", "history": []})
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "message"]
+
+    def test_chat_rejects_oversized_history(self, client: TestClient) -> None:
+        """Test that more than 100 history messages is a validation error."""
+        history = [{"role": "user", "content": "Hi"}] * 101
+
+        with patch("main.process_request_async", AsyncMock(return_value="Done")) as mock_process:
+            response = client.post("/chat", json={"message": "Hello", "history": history})
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "too_long"
+        mock_process.assert_not_awaited()
+
+    def test_chat_rejects_malformed_json(self, client: TestClient) -> None:
+        """Test that a body that is not valid JSON is a validation error, not a server error."""
+        response = client.post("/chat", content=b"{bad", headers={"Content-Type": "application/json"})
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "json_invalid"
+
+    def test_chat_request_schema_is_documented(self, client: TestClient) -> None:
+        """Test that the OpenAPI document still describes the chat request body."""
+        openapi = client.get("/openapi.json").json()
+
+        schema = openapi["paths"]["/chat"]["post"]["requestBody"]["content"]["application/json"]["schema"]
+        assert schema["required"] == ["message"]
+        assert schema["properties"]["history"]["items"]["$ref"] in {
+            f"#/components/schemas/{name}" for name in openapi["components"]["schemas"]
+        }
+
+
+class TestChatStreamEndpoint:
+    """Tests for the /chat/stream endpoint."""
+
+    def test_chat_stream_emits_deltas_then_history(self, client: TestClient) -> None:
+        """Test that text deltas are streamed before the closing history event."""
+
+        async def fake_stream(message: str, history: list[dict[str, Any]]) -> AsyncIterator[str]:
+            history.append({"role": "user", "content": message})
+            yield "Hello "
+            yield "back"
+
+        with patch("main.stream_request_async", fake_stream):
+            response = client.post("/chat/stream", json={"message": "Hello", "history": []})
+
+        events = [json.loads(line.removeprefix("data: ")) for line in response.text.splitlines() if line]
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert [event["delta"] for event in events[:-1]] == ["Hello ", "back"]
+        assert events[-1] == {
+            "done": True,
+            "updated_history": [
+                {"role": "user", "content": "Hello"},
+                {"role": "assistant", "content": "Hello back"},
+            ],
+        }
+
+    async def test_chat_stream_finishes_turn_after_disconnect(self) -> None:
+        """Test that a client leaving mid-answer neither stops the agent nor loses the session turn."""
+        main.limiter.reset()
+        main.app.state.session_store = InMemorySessionStore()
+        main.app.state.agent_slots = asyncio.Semaphore(1)
+        resume = asyncio.Event()
+
+        async def fake_stream(message: str, history: list[dict[str, Any]]) -> AsyncIterator[str]:
+            history.append({"role": "user", "content": message})
+            yield "Deleting "
+            await resume.wait()
+            history.append({"role": "assistant", "content": "Deleting bucket"})
+            yield "bucket"
+
+        request = Request(
+            {
+                "type": "http",
+                "app": main.app,
+                "method": "POST",
+                "path": "/chat/stream",
+                "headers": [],
+                "client": ("127.0.0.1", 1),
+            }
+        )
+        first_delta = asyncio.Event()
+
+        async def client() -> None:
+            async for _ in response.body_iterator:
+                first_delta.set()
+
+        with patch("main.stream_request_async", fake_stream):
+            response = await main.chat_stream(ChatRequest(message="Delete bucket", session_id="abc"), request)
+            reader = asyncio.create_task(client())
+            await first_delta.wait()
+            reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)
+
+            # The agent is still running, so its concurrency slot is still taken.
+            assert main.app.state.agent_slots.locked()
+            resume.set()
+            await asyncio.gather(*main._running_turns)
+
+        assert await main.app.state.session_store.get_history("abc") == [
+            {"role": "user", "content": "Delete bucket"},
+            {"role": "assistant", "content": "Deleting bucket"},
+        ]
+        assert not main.app.state.agent_slots.locked()
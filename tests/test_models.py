@@ -0,0 +1,63 @@
+"""Tests for request and tool input models."""
+
+import pytest
+from pydantic import ValidationError
+
+from agentic_aws.models import CHAT_HISTORY_ADAPTER, AWSResourceInput, ChatMessage
+
+
+class TestAWSResourceInput:
+    """Tests for AWSResourceInput validation."""
+
+    def test_accepts_supported_region(self) -> None:
+        """Test that a supported region is accepted."""
+        resource_input = AWSResourceInput(operation="list", resource_type="AWS::S3::Bucket", region="eu-west-1")
+
+        assert resource_input.region == "eu-west-1"
+
+    def test_rejects_unsupported_region(self) -> None:
+        """Test that an unknown region is rejected."""
+        with pytest.raises(ValidationError, match="Input should be .us-east-1."):
+            AWSResourceInput(operation="list", resource_type="AWS::S3::Bucket", region="mars-1")
+
+    @pytest.mark.parametrize("resource_type", ["AWS::S3", "aws::s3::bucket", "AWS::S3::Bucket::Extra"])
+    def test_rejects_malformed_resource_type(self, resource_type: str) -> None:
+        """Test that resource types must follow AWS::Service::Resource."""
+        with pytest.raises(ValidationError, match="should match pattern"):
+            AWSResourceInput(operation="list", resource_type=resource_type)
+
+    def test_rejects_unsafe_identifier(self) -> None:
+        """Test that identifiers with characters outside the safe set are rejected."""
+        with pytest.raises(ValidationError, match="should match pattern"):
+            AWSResourceInput(operation="read", resource_type="AWS::S3::Bucket", identifier="bucket; rm -rf /")
+
+    def test_accepts_missing_identifier(self) -> None:
+        """Test that the identifier stays optional."""
+        resource_input = AWSResourceInput(operation="list", resource_type="AWS::S3::Bucket")
+
+        assert resource_input.identifier is None
+
+
+class TestChatMessage:
+    """Tests for ChatMessage."""
+
+    def test_is_immutable_and_hashable(self) -> None:
+        """Test that messages can be shared between histories and used as keys."""
+        message = ChatMessage(role="user", content="Hi")
+
+        with pytest.raises(ValidationError, match="frozen"):
+            message.content = "Bye"  # type: ignore[misc]
+        assert hash(message) == hash(ChatMessage(role="user", content=" Hi "))
+
+
+class TestChatHistoryAdapter:
+    """Tests for the shared chat history adapter."""
+
+    def test_round_trips_history(self) -> None:
+        """Test that history dicts validate into messages and dump back unchanged."""
+        history = [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello"}]
+
+        messages = CHAT_HISTORY_ADAPTER.validate_python(history)
+
+        assert all(isinstance(message, ChatMessage) for message in messages)
+        assert CHAT_HISTORY_ADAPTER.dump_python(messages) == history
@@ -0,0 +1,19 @@
+"""Tests for the package's lazy exports."""
+
+import pytest
+
+import agentic_aws
+
+
+class TestLazyExports:
+    """Tests for attribute access on the agentic_aws package."""
+
+    @pytest.mark.parametrize("name", agentic_aws.__all__)
+    def test_all_exports_resolve(self, name: str) -> None:
+        """Test that every name in __all__ can be imported from the package."""
+        assert getattr(agentic_aws, name) is not None
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test that unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="no_such_name"):
+            _ = agentic_aws.no_such_name
@@ -0,0 +1,72 @@
+"""Tests for the request processor."""
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agentic_aws import processor
+from agentic_aws.processor import get_agent, stream_request_async
+
+
+class TestGetAgent:
+    """Tests for get_agent."""
+
+    @pytest.fixture(autouse=True)
+    def reset_agent(self) -> Iterator[None]:
+        """Start each test without a cached agent."""
+        with patch.object(processor, "_agent", None):
+            yield
+
+    def test_concurrent_first_calls_create_one_agent(self) -> None:
+        """Test that threads racing on the first call all get the same single agent."""
+        created = []
+
+        def slow_agent() -> object:
+            time.sleep(0.05)
+            agent = object()
+            created.append(agent)
+            return agent
+
+        barrier = threading.Barrier(4)
+
+        def call() -> object:
+            barrier.wait()
+            return get_agent()
+
+        with (
+            patch("agentic_aws.agent.AWSAgenticAgent", side_effect=slow_agent),
+            ThreadPoolExecutor(max_workers=4) as executor,
+        ):
+            agents = list(executor.map(lambda _: call(), range(4)))
+
+        assert len(created) == 1
+        assert all(agent is created[0] for agent in agents)
+
+
+class TestStreamRequestAsync:
+    """Tests for stream_request_async."""
+
+    async def test_yields_text_in_order(self) -> None:
+        """Test that text produced in the worker thread is yielded in order."""
+
+        def fake_process(
+            user_input: str,
+            history: list[dict[str, str]],  # noqa: ARG001
+            on_text: Callable[[str], None] | None = None,
+        ) -> str:
+            assert on_text is not None
+            for chunk in ("one ", "two ", user_input):
+                on_text(chunk)
+            return "one two three"
+
+        agent = MagicMock()
+        agent.process_request.side_effect = fake_process
+
+        with patch("agentic_aws.processor.get_agent", return_value=agent):
+            chunks = [chunk async for chunk in stream_request_async("three", [])]
+
+        assert chunks == ["one ", "two ", "three"]
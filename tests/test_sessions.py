@@ -0,0 +1,49 @@
+"""Tests for server-side session storage."""
+
+from agentic_aws.sessions import InMemorySessionStore, trim_history
+
+
+class TestTrimHistory:
+    """Tests for the history window helper."""
+
+    def test_keeps_most_recent_messages(self) -> None:
+        """Test that only the last max_messages are kept."""
+        messages = [{"role": "user" if i % 2 == 0 else "assistant", "content": str(i)} for i in range(10)]
+
+        window = trim_history(messages, max_messages=4)
+
+        assert [msg["content"] for msg in window] == ["6", "7", "8", "9"]
+
+    def test_window_starts_at_user_text_turn(self) -> None:
+        """Test that a window never starts with a tool result or assistant turn."""
+        messages = [
+            {"role": "user", "content": "Create a bucket"},
+            {"role": "assistant", "content": [{"type": "tool_use", "id": "t1"}]},
+            {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "t1"}]},
+            {"role": "assistant", "content": [{"type": "text", "text": "Done"}]},
+            {"role": "user", "content": "Thanks"},
+        ]
+
+        window = trim_history(messages, max_messages=3)
+
+        assert window == [{"role": "user", "content": "Thanks"}]
+
+
+class TestInMemorySessionStore:
+    """Tests for InMemorySessionStore class."""
+
+    async def test_append_and_get_history(self) -> None:
+        """Test that appended messages are returned for the same session only."""
+        store = InMemorySessionStore()
+        await store.append("abc", [{"role": "user", "content": "Hello"}, {"role": "assistant", "content": "Hi"}])
+
+        assert len(await store.get_history("abc")) == 2
+        assert await store.get_history("other") == []
+
+    async def test_append_caps_stored_messages(self) -> None:
+        """Test that each session keeps at most max_messages."""
+        store = InMemorySessionStore(max_messages=2)
+        for i in range(5):
+            await store.append("abc", [{"role": "user", "content": str(i)}])
+
+        assert [msg["content"] for msg in await store.get_history("abc")] == ["3", "4"]